@@ -0,0 +1,205 @@
+"""
+Vectorized point-in-zone containment tests
+
+Tests many points against the rings of one Polygon/MultiPolygon, or one point against many zones, using NumPy.
+Rings crossing the antimeridian and rings enclosing a pole are handled by unwrapping longitudes before testing.
+Requires the optional `numpy` dependency.
+"""
+
+import math
+from collections.abc import Sequence
+
+try:
+    import numpy as np
+    from numpy.typing import ArrayLike
+except ImportError as e:  # pragma: no cover
+    raise ImportError("ed318_pydantic.containment requires numpy, install ed318-pydantic[numpy]") from e
+
+from .geometries import EARTH_RADIUS, Geometry, MultiPolygon, Point, Polygon, circle_bounds, flatten_geometry
+
+METERS_PER_DEGREE = EARTH_RADIUS * math.pi / 180
+"""Length of one degree of latitude in meters."""
+
+_CHUNK_SIZE = 1 << 20
+"""Maximum number of point/edge pairs evaluated at once, bounding temporary memory to a few MB."""
+
+_CHUNK_POINTS = 256
+"""Maximum number of points evaluated at once; smaller chunks span narrower latitude bands and fewer edges."""
+
+
+def _unwrap(ring: np.ndarray) -> np.ndarray:
+    """Unwrap ring longitudes into a continuous sequence, closing rings around a pole via the pole."""
+    ring = ring.copy()
+    ring[:, 0] = np.unwrap(ring[:, 0], period=360)
+    if abs(ring[-1, 0] - ring[0, 0]) > 180:
+        pole = 90.0 if ring[:, 1].mean() > 0 else -90.0
+        ring = np.vstack([ring, [[ring[-1, 0], pole], [ring[0, 0], pole], ring[0]]])
+    return ring
+
+
+def _prepare_polygon(polygon: Sequence[Sequence[Sequence[float]]]) -> list[np.ndarray]:
+    exterior, *holes = (_unwrap(np.asarray(ring, dtype=float)[:, :2]) for ring in polygon)
+    # move the exterior so its western edge lies in [-180, 180), and every hole next to the exterior
+    exterior[:, 0] -= 360 * math.floor((exterior[:, 0].min() + 180) / 360)
+    center = exterior[:, 0].mean()
+    for hole in holes:
+        hole[:, 0] -= 360 * round((hole[:, 0].mean() - center) / 360)
+    return [exterior, *holes]
+
+
+class RingSet:
+    """Prepared edges of a Polygon or MultiPolygon.
+
+    All rings, including holes, are tested together using the even-odd rule. Longitudes are unwrapped, so that
+    edges may extend beyond 180°; points are tested both at their longitude and shifted by 360°.
+    """
+
+    def __init__(self, geometry: Polygon | MultiPolygon):
+        polygons = [geometry.coordinates] if isinstance(geometry, Polygon) else geometry.coordinates
+        rings = [ring for polygon in polygons for ring in _prepare_polygon(polygon)]
+        starts = np.vstack([ring[:-1] for ring in rings])
+        ends = np.vstack([ring[1:] for ring in rings])
+        self.x0, self.y0 = starts[:, 0], starts[:, 1]
+        self.x1, self.y1 = ends[:, 0], ends[:, 1]
+        dy = self.y1 - self.y0
+        self.y_min, self.y_max = np.minimum(self.y0, self.y1), np.maximum(self.y0, self.y1)
+        self.slope = np.divide(self.x1 - self.x0, dy, out=np.zeros_like(dy), where=dy != 0)
+        self.bounds = (
+            float(min(self.x0.min(), self.x1.min())),
+            float(self.y_min.min()),
+            float(max(self.x0.max(), self.x1.max())),
+            float(self.y_max.max()),
+        )
+        self._shifts = (0.0, 360.0) if self.bounds[2] > 180 else (0.0,)
+
+    def contains(self, lon: ArrayLike, lat: ArrayLike, tolerance: float = 0.0) -> np.ndarray:
+        """Test which points lie within the rings.
+
+        Points closer than `tolerance` meters to any edge count as contained, so a positive tolerance makes the
+        boundary inclusive. Returns a boolean array of the broadcast shape of `lon` and `lat`.
+        """
+        lon, lat = np.broadcast_arrays(np.asarray(lon, dtype=float), np.asarray(lat, dtype=float))
+        px = (lon.ravel() + 180) % 360 - 180
+        py = lat.ravel()
+        result = np.zeros(px.shape, dtype=bool)
+
+        # points are processed in latitude order, so that each chunk only needs the edges overlapping its band
+        order = np.argsort(py, kind="stable")
+        margin = tolerance / METERS_PER_DEGREE
+        step = min(_CHUNK_POINTS, max(1, _CHUNK_SIZE // len(self.x0)))
+        for i in range(0, len(order), step):
+            chunk = order[i : i + step]
+            edges = np.flatnonzero((self.y_max >= py[chunk[0]] - margin) & (self.y_min <= py[chunk[-1]] + margin))
+            if len(edges):
+                result[chunk] = self._contains(px[chunk], py[chunk], tolerance, edges)
+        return result.reshape(lon.shape)
+
+    def crossings(self, lat: ArrayLike) -> tuple[np.ndarray, np.ndarray]:
+        """Return all crossings of the edges with a set of parallels, in the unwrapped frame of the rings.
+
+        Returns the index of the crossed parallel and the longitude of every crossing, ordered by parallel and
+        longitude. Consecutive pairs of crossings of a parallel delimit the intervals inside the rings, which
+        allows scanline filling of many rows at once.
+        """
+        lat = np.asarray(lat, dtype=float).ravel()
+        rows, longitudes = [], []
+        if len(lat):
+            edges = np.flatnonzero((self.y_max >= lat.min()) & (self.y_min <= lat.max()))
+            step = max(1, _CHUNK_SIZE // max(1, len(edges)))
+            x0, y0, y1, slope = self.x0[edges], self.y0[edges], self.y1[edges], self.slope[edges]
+            for i in range(0, len(lat), step):
+                y = lat[i : i + step, None]
+                row, edge = np.nonzero((y0 > y) != (y1 > y))
+                rows.append(row + i)
+                longitudes.append(x0[edge] + (y[row, 0] - y0[edge]) * slope[edge])
+        row = np.concatenate(rows) if rows else np.zeros(0, dtype=np.intp)
+        x = np.concatenate(longitudes) if longitudes else np.zeros(0)
+        order = np.lexsort((x, row))
+        return row[order], x[order]
+
+    def _contains(self, px: np.ndarray, py: np.ndarray, tolerance: float, edges: np.ndarray) -> np.ndarray:
+        x0, y0, x1, y1 = self.x0[edges], self.y0[edges], self.x1[edges], self.y1[edges]
+        y = py[:, None]
+        spans = (y0 > y) != (y1 > y)
+        x_cross = x0 + (y - y0) * self.slope[edges]
+        result = np.zeros(px.shape, dtype=bool)
+        for shift in self._shifts:
+            x = px[:, None] + shift
+            result |= np.count_nonzero(spans & (x < x_cross), axis=1) % 2 == 1
+            if tolerance > 0:
+                result |= _near(x, y, x0, y0, x1, y1, tolerance)
+        return result
+
+
+def _near(
+    x: np.ndarray, y: np.ndarray, x0: np.ndarray, y0: np.ndarray, x1: np.ndarray, y1: np.ndarray, tolerance: float
+) -> np.ndarray:
+    """Test which points are closer than `tolerance` meters to any edge, in a local equirectangular projection."""
+    kx = np.cos(np.radians(y)) * METERS_PER_DEGREE
+    ax, ay = (x - x0) * kx, (y - y0) * METERS_PER_DEGREE
+    bx, by = (x1 - x0) * kx, (y1 - y0) * METERS_PER_DEGREE
+    length = bx * bx + by * by
+    t = np.clip(np.divide(ax * bx + ay * by, length, out=np.zeros_like(ax), where=length > 0), 0, 1)
+    return ((ax - t * bx) ** 2 + (ay - t * by) ** 2 <= tolerance * tolerance).any(axis=1)
+
+
+class Circle:
+    """Prepared circular extent of a Point geometry."""
+
+    def __init__(self, geometry: Point):
+        if geometry.extent is None:
+            raise ValueError("a Point geometry needs a circle extent to contain other points")
+        self.lon, self.lat = geometry.coordinates[0], geometry.coordinates[1]
+        self.radius = geometry.extent.radius
+        # like RingSet.bounds, extends beyond 180° for circles crossing the antimeridian
+        self.bounds = circle_bounds(self.lon, self.lat, self.radius)
+
+    def contains(self, lon: ArrayLike, lat: ArrayLike, tolerance: float = 0.0) -> np.ndarray:
+        """Test which points lie within the circle, using the haversine distance."""
+        lon, lat = np.radians(lon), np.radians(lat)
+        lon0, lat0 = math.radians(self.lon), math.radians(self.lat)
+        h = np.sin((lat - lat0) / 2) ** 2 + np.cos(lat) * math.cos(lat0) * np.sin((lon - lon0) / 2) ** 2
+        distance = 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.clip(h, 0, 1)))
+        return distance <= self.radius + tolerance
+
+
+def prepare(geometry: Geometry) -> list[RingSet | Circle]:
+    """Prepare all areal parts of a geometry; points without extent and line strings are skipped."""
+    parts: list[RingSet | Circle] = []
+    for item, _ in flatten_geometry(geometry):
+        if isinstance(item, (Polygon, MultiPolygon)):
+            parts.append(RingSet(item))
+        elif isinstance(item, Point) and item.extent is not None:
+            parts.append(Circle(item))
+    return parts
+
+
+class ZoneIndex:
+    """Containment index over the areal parts of many zone geometries.
+
+    Parts are pre-filtered by their bounding boxes before running the exact test. Bounding boxes of parts crossing
+    the antimeridian extend beyond 180°, so points are matched against them both as given and shifted by 360°.
+    """
+
+    def __init__(self, geometries: Sequence[Geometry]):
+        self.parts: list[RingSet | Circle] = []
+        zones = []
+        for zone, geometry in enumerate(geometries):
+            for part in prepare(geometry):
+                self.parts.append(part)
+                zones.append(zone)
+        self.zones = np.asarray(zones, dtype=np.intp)
+        self.bounds = np.asarray([part.bounds for part in self.parts], dtype=float).reshape(-1, 4)
+
+    def zones_containing(self, lon: float, lat: float, tolerance: float = 0.0) -> list[int]:
+        """Return the indices of all zones containing a point, in ascending order."""
+        margin_lat = tolerance / METERS_PER_DEGREE
+        margin_lon = margin_lat / max(math.cos(math.radians(lat)), 1e-9)
+        west, south, east, north = self.bounds.T
+        lon = (lon + 180) % 360 - 180
+        in_lon = ((west - margin_lon <= lon) & (lon <= east + margin_lon)) | (
+            (west - margin_lon <= lon + 360) & (lon + 360 <= east + margin_lon)
+        )
+        candidates = np.flatnonzero(in_lon & (south - margin_lat <= lat) & (lat <= north + margin_lat))
+        zones = {int(self.zones[i]) for i in candidates if self.parts[i].contains(lon, lat, tolerance)}
+        return sorted(zones)
@@ -0,0 +1,206 @@
+"""
+Route and corridor intersection queries
+
+Determines which zones a flight plan crosses, when, and at which altitudes, for polyline routes with altitude and
+time profiles. Requires the optional `numpy` dependency.
+"""
+
+import math
+from collections.abc import Sequence
+from datetime import datetime
+from typing import NamedTuple
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError("ed318_pydantic.corridor requires numpy, install ed318-pydantic[numpy]") from e
+
+from pydantic import BaseModel
+
+from .containment import METERS_PER_DEGREE, Circle, RingSet
+from .geometries import MultiPolygon, Point, Polygon, flatten_geometry, layer_limits
+from .models import Feature
+
+_REFINE_STEPS = 16
+"""Bisection steps used to locate entry and exit points between two samples."""
+
+
+class Waypoint(BaseModel):
+    """A 4D position along a route."""
+
+    lon: float
+    lat: float
+    altitude: float
+    """Altitude in meters, relative to the same vertical reference as the zones' VerticalLayers."""
+    time: datetime
+
+
+class ZoneCrossing(BaseModel):
+    """A continuous stretch of a route within a zone."""
+
+    identifier: str
+    entry: Waypoint
+    exit: Waypoint
+    entry_segment: int
+    """Index of the route segment on which the zone is entered."""
+    exit_segment: int
+    """Index of the route segment on which the zone is left."""
+
+
+class _Part(NamedTuple):
+    shape: RingSet | Circle
+    lower: float
+    upper: float
+
+
+class _Segment:
+    """Linear interpolation between two waypoints, with the longitude unwrapped across the antimeridian."""
+
+    def __init__(self, start: Waypoint, end: Waypoint):
+        self.start = start
+        self.lon0, self.lat0, self.alt0 = start.lon, start.lat, start.altitude
+        self.dlon = (end.lon - start.lon + 180) % 360 - 180
+        self.dlat = end.lat - start.lat
+        self.dalt = end.altitude - start.altitude
+        self.duration = end.time - start.time
+        dx = self.dlon * math.cos(math.radians(start.lat + self.dlat / 2)) * METERS_PER_DEGREE
+        self.length = math.hypot(dx, self.dlat * METERS_PER_DEGREE, self.dalt)
+        west, east = sorted((self.lon0, self.lon0 + self.dlon))
+        self.bounds = (west, min(start.lat, end.lat), east, max(start.lat, end.lat))
+
+    def at(self, t: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, list[datetime]]:
+        times = [self.start.time + self.duration * float(value) for value in t]
+        return self.lon0 + t * self.dlon, self.lat0 + t * self.dlat, self.alt0 + t * self.dalt, times
+
+    def waypoint(self, t: float) -> Waypoint:
+        (lon,), (lat,), (altitude,), (time,) = self.at(np.asarray([t]))
+        return Waypoint(lon=(float(lon) + 180) % 360 - 180, lat=float(lat), altitude=float(altitude), time=time)
+
+
+class CorridorIndex:
+    """Prepared zones for route intersection queries.
+
+    Zones are represented by the areal parts of their geometries (Polygons, MultiPolygons and Points with a circle
+    extent), each with the altitude limits of its VerticalLayer. LineString zones are ignored.
+    """
+
+    def __init__(self, features: Sequence[Feature]):
+        self.features = list(features)
+        self.parts: list[_Part] = []
+        owners = []
+        for i, feature in enumerate(self.features):
+            for geometry, layer in flatten_geometry(feature.geometry):
+                if isinstance(geometry, (Polygon, MultiPolygon)):
+                    shape: RingSet | Circle = RingSet(geometry)
+                elif isinstance(geometry, Point) and geometry.extent is not None:
+                    shape = Circle(geometry)
+                else:
+                    continue
+                lower, upper = layer_limits(layer)
+                self.parts.append(_Part(shape, lower=lower, upper=upper))
+                owners.append(i)
+        self.owners = np.asarray(owners, dtype=np.intp)
+        self.bounds = np.asarray([part.shape.bounds for part in self.parts], dtype=float).reshape(-1, 4)
+
+    def _candidates(self, segment: _Segment, buffer: float) -> dict[int, list[_Part]]:
+        """Return the parts whose bounding boxes intersect the buffered segment, grouped by zone."""
+        margin_lat = buffer / METERS_PER_DEGREE
+        max_lat = max(abs(segment.bounds[1]), abs(segment.bounds[3])) + margin_lat
+        margin_lon = margin_lat / max(math.cos(math.radians(min(max_lat, 90.0))), 1e-9)
+        west, south, east, north = (
+            segment.bounds[0] - margin_lon,
+            segment.bounds[1] - margin_lat,
+            segment.bounds[2] + margin_lon,
+            segment.bounds[3] + margin_lat,
+        )
+        part_west, part_south, part_east, part_north = self.bounds.T
+        in_lon = np.zeros(len(self.parts), dtype=bool)
+        for shift in (-360.0, 0.0, 360.0):
+            in_lon |= (part_west + shift <= east) & (part_east + shift >= west)
+        candidates: dict[int, list[_Part]] = {}
+        for i in np.flatnonzero(in_lon & (part_south <= north) & (part_north >= south)):
+            candidates.setdefault(int(self.owners[i]), []).append(self.parts[i])
+        return candidates
+
+    def _inside(
+        self, zone: int, parts: list[_Part], segment: _Segment, t: np.ndarray, buffer: float, vertical_buffer: float
+    ) -> np.ndarray:
+        lon, lat, altitude, times = segment.at(t)
+        result = np.zeros(t.shape, dtype=bool)
+        for part in parts:
+            in_layer = (altitude >= part.lower - vertical_buffer) & (altitude <= part.upper + vertical_buffer)
+            if in_layer.any():
+                result |= in_layer & part.shape.contains(lon, lat, buffer)
+        zone_properties = self.features[zone].properties
+        if zone_properties.limitedApplicability is not None:
+            for i in np.flatnonzero(result):
+                result[i] = zone_properties.applies_at(times[i])
+        return result
+
+    def _refine(
+        self, zone: int, parts: list[_Part], segment: _Segment, outside: float, inside: float, **buffers: float
+    ) -> float:
+        """Bisect the boundary between a sample outside and a sample inside the zone."""
+        for _ in range(_REFINE_STEPS):
+            middle = (outside + inside) / 2
+            if self._inside(zone, parts, segment, np.asarray([middle]), **buffers)[0]:
+                inside = middle
+            else:
+                outside = middle
+        return inside
+
+    def crossings(
+        self, route: Sequence[Waypoint], buffer: float = 0.0, vertical_buffer: float = 0.0, resolution: float = 50.0
+    ) -> list[ZoneCrossing]:
+        """Return all zone crossings of a route, ordered by entry.
+
+        The route is swept by a corridor of `buffer` meters horizontally and `vertical_buffer` meters vertically;
+        a zone is crossed where the corridor overlaps a zone part within its altitude limits while the zone
+        applies according to its limitedApplicability. Segments are sampled every `resolution` meters (3D
+        distance) and entry and exit points are refined by bisection, so zone features narrower than the
+        resolution may be missed.
+        """
+        buffers = {"buffer": buffer, "vertical_buffer": vertical_buffer}
+        result: list[ZoneCrossing] = []
+        open_crossings: dict[int, ZoneCrossing] = {}
+
+        for index, (start, end) in enumerate(zip(route[:-1], route[1:])):
+            segment = _Segment(start, end)
+            t = np.linspace(0.0, 1.0, max(2, math.ceil(segment.length / resolution) + 1))
+            candidates = self._candidates(segment, buffer)
+            for zone in list(open_crossings):
+                if zone not in candidates:
+                    result.append(open_crossings.pop(zone))
+
+            for zone, parts in candidates.items():
+                inside = self._inside(zone, parts, segment, t, **buffers)
+                if zone in open_crossings and not inside[0]:
+                    result.append(open_crossings.pop(zone))
+
+                changes = np.flatnonzero(np.diff(inside.astype(np.int8)))
+                if inside[0] and zone not in open_crossings:
+                    open_crossings[zone] = self._crossing(zone, segment.waypoint(0.0), index)
+                for i in changes:
+                    if inside[i + 1]:
+                        entry = self._refine(zone, parts, segment, t[i], t[i + 1], **buffers)
+                        open_crossings[zone] = self._crossing(zone, segment.waypoint(entry), index)
+                    else:
+                        leave = self._refine(zone, parts, segment, t[i + 1], t[i], **buffers)
+                        crossing = open_crossings.pop(zone)
+                        crossing.exit, crossing.exit_segment = segment.waypoint(leave), index
+                        result.append(crossing)
+                if inside[-1]:
+                    crossing = open_crossings[zone]
+                    crossing.exit, crossing.exit_segment = segment.waypoint(1.0), index
+
+        result.extend(open_crossings.values())
+        return sorted(result, key=lambda crossing: (crossing.entry.time, crossing.identifier))
+
+    def _crossing(self, zone: int, entry: Waypoint, segment: int) -> ZoneCrossing:
+        return ZoneCrossing(
+            identifier=self.features[zone].properties.identifier,
+            entry=entry,
+            exit=entry,
+            entry_segment=segment,
+            exit_segment=segment,
+        )
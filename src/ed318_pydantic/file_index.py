@@ -0,0 +1,178 @@
+"""
+Byte-range index for random access into large ED-318 data set files
+
+Scans a raw data set once, without building models, and records the location, identifier and bounding box of
+every feature. The index is stored next to the data set, so that later lookups only parse the features they need.
+"""
+
+import json
+import mmap
+import os
+import re
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Self
+
+from pydantic import BaseModel, ValidationError
+
+from .geometries import bounds_intersect, circle_bounds, coordinate_bounds, merge_bounds
+from .models import Feature
+
+_TOKEN = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]]')
+"""JSON strings and brackets; everything else is irrelevant for locating features."""
+
+
+def scan_features(data: bytes | mmap.mmap) -> Iterator[tuple[int, int]]:
+    """Yield the (offset, length) of every element of the top-level `features` array of a JSON document."""
+    depth = 0
+    key = b""
+    in_features = False
+    start = 0
+    for match in _TOKEN.finditer(data):
+        char = data[match.start()]
+        if char == ord('"'):
+            if depth == 1:
+                key = match.group()
+        elif char in b"{[":
+            depth += 1
+            if depth == 2 and char == ord("[") and key == b'"features"':
+                in_features = True
+            elif depth == 3 and in_features:
+                start = match.start()
+        else:
+            if depth == 3 and in_features:
+                yield start, match.end() - start
+            elif depth == 2:
+                in_features = False
+            depth -= 1
+
+
+def _raw_bounds(geometry: dict[str, Any]) -> tuple[float, float, float, float] | None:
+    """Return the bounding box of a raw geometry, computed like `geometry_bounds`."""
+    bounds = []
+    stack = [geometry]
+    while stack:
+        item = stack.pop()
+        if "geometries" in item:
+            stack.extend(item["geometries"])
+            continue
+        extent = item.get("extent")
+        if item.get("type") == "Point" and isinstance(extent, dict) and "radius" in extent:
+            bounds.append(circle_bounds(item["coordinates"][0], item["coordinates"][1], extent["radius"]))
+        else:
+            bounds.append(coordinate_bounds(item["coordinates"]))
+    return merge_bounds(bounds)
+
+
+class IndexEntry(BaseModel):
+    identifier: str
+    offset: int
+    """Byte offset of the feature in the data set file."""
+    length: int
+    """Length of the feature in bytes."""
+    bbox: tuple[float, float, float, float] | None
+    """Bounding box (west, south, east, north) of the feature geometry, see `merge_bounds`; None if it is empty."""
+
+
+class FeatureIndex(BaseModel):
+    """Byte-range index of the features of an ED-318 data set file."""
+
+    size: int
+    """Size of the indexed file, used to detect stale indexes."""
+    mtime_ns: int
+    """Modification time of the indexed file, used to detect stale indexes."""
+    entries: list[IndexEntry]
+
+    @staticmethod
+    def index_path(path: Path) -> Path:
+        return path.with_name(path.name + ".index.json")
+
+    @classmethod
+    def build(cls, path: Path) -> Self:
+        """Scan a data set file and index its features."""
+        stat = path.stat()
+        entries = []
+        with path.open("rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for offset, length in scan_features(data):
+                feature = json.loads(data[offset : offset + length])
+                properties = feature["properties"]
+                identifier = properties.get("identifier") or properties.get("UASZone", {}).get("identifier", "")
+                entries.append(
+                    IndexEntry(
+                        identifier=identifier, offset=offset, length=length, bbox=_raw_bounds(feature["geometry"])
+                    )
+                )
+        return cls(size=stat.st_size, mtime_ns=stat.st_mtime_ns, entries=entries)
+
+    def is_current(self, path: Path) -> bool:
+        stat = path.stat()
+        return (stat.st_size, stat.st_mtime_ns) == (self.size, self.mtime_ns)
+
+    @classmethod
+    def for_file(cls, path: Path) -> Self:
+        """Load the index stored next to a data set file, (re)building and storing it if missing or stale.
+
+        The index is replaced atomically, so concurrent readers never see a partially written index. If it
+        cannot be stored, e.g. in a read-only directory, the rebuilt index is only kept in memory.
+        """
+        index_path = cls.index_path(path)
+        try:
+            index = cls.model_validate_json(index_path.read_bytes())
+            if index.is_current(path):
+                return index
+        except (OSError, ValidationError):
+            pass
+        index = cls.build(path)
+        temporary = index_path.with_name(f"{index_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            temporary.write_text(index.model_dump_json())
+            os.replace(temporary, index_path)
+        except OSError:
+            temporary.unlink(missing_ok=True)
+        return index
+
+
+class IndexedDataset:
+    """Random access to the features of a memory-mapped ED-318 data set file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.index = FeatureIndex.for_file(path)
+        self._entries = {entry.identifier: entry for entry in reversed(self.index.entries)}
+        self._file = path.open("rb")
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._data.close()
+        self._file.close()
+
+    def __len__(self) -> int:
+        return len(self.index.entries)
+
+    def __contains__(self, identifier: object) -> bool:
+        return identifier in self._entries
+
+    def _load(self, entry: IndexEntry) -> Feature:
+        return Feature.model_validate_json(self._data[entry.offset : entry.offset + entry.length])
+
+    def get(self, identifier: str) -> Feature:
+        """Parse the (first) feature with the given identifier, raising a KeyError if there is none."""
+        return self._load(self._entries[identifier])
+
+    def query(self, bounds: tuple[float, float, float, float]) -> list[Feature]:
+        """Parse all features whose bounding box intersects a (west, south, east, north) bounding box.
+
+        Bounding boxes crossing the antimeridian are supported, see `merge_bounds`.
+        """
+        return [
+            self._load(entry)
+            for entry in self.index.entries
+            if entry.bbox is not None and bounds_intersect(entry.bbox, bounds)
+        ]
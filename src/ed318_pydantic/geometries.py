@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Annotated, ClassVar, Literal, TypeVar, Union
+import math
+from collections.abc import Iterable, Iterator
+from typing import Annotated, Any, ClassVar, Literal, TypeVar, Union
 
 import geojson_pydantic as geojson
 from pydantic import BaseModel, Field, model_validator
@@ -10,6 +12,12 @@ from .util import Uppercase, get_list_depth
 
 T = TypeVar("T")
 
+EARTH_RADIUS = 6_371_008.8
+"""Mean radius of the Earth in meters, used to approximate distances on the WGS84 ellipsoid."""
+
+FEET = 0.3048
+"""Length of a foot in meters."""
+
 CodeVerticalReferenceType = Uppercase[Literal["AGL", "AMSL", "WGS84"]]
 """ED-318 4.2.3.3 CodeVerticalReferenceType
 
@@ -52,6 +60,15 @@ class VerticalLayer(BaseModel):
     """The unit of measurement in which the upper and lower values are expressed (m) or (ft)."""
 
 
+def layer_limits(layer: VerticalLayer) -> tuple[float, float]:
+    """Return the (lower, upper) limits of a VerticalLayer in meters.
+
+    Vertical references are not converted, limits relative to different references are compared as they are.
+    """
+    factor = FEET if layer.uom == "ft" else 1.0
+    return layer.lower * factor, layer.upper * factor
+
+
 class _ED318GeometryMixin(BaseModel):
     layer: VerticalLayer
     _expected_coordinate_list_depth: ClassVar[int]
@@ -107,9 +124,17 @@ coordinate_depth_map = {
 }
 
 
+LayeredGeometry = Point | MultiPoint | LineString | MultiLineString | Polygon | MultiPolygon
+"""Any ED-318 geometry that carries its own VerticalLayer, i.e. every geometry except a GeometryCollection."""
+
+
 class GeometryCollection(geojson.GeometryCollection):
     geometries: list[Geometry]
 
+    def flatten(self) -> list[tuple[LayeredGeometry, VerticalLayer]]:
+        """Flatten this collection into (geometry, layer) pairs, see `flatten_geometry`."""
+        return flatten_geometry(self)
+
 
 Geometry = Annotated[
     Union[
@@ -125,3 +150,156 @@ Geometry = Annotated[
 ]
 
 GeometryCollection.model_rebuild()
+
+
+def flatten_geometry(geometry: Geometry) -> list[tuple[LayeredGeometry, VerticalLayer]]:
+    """Flatten a geometry into a list of (geometry, layer) pairs.
+
+    Nested GeometryCollections are resolved iteratively in document order, so that downstream 3D checks can
+    iterate over all member geometries and their vertical extents without recursing themselves.
+    """
+    pairs: list[tuple[LayeredGeometry, VerticalLayer]] = []
+    stack: list[Geometry] = [geometry]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, GeometryCollection):
+            stack.extend(reversed(item.geometries))
+        else:
+            pairs.append((item, item.layer))
+    return pairs
+
+
+def _normalize_bounds(bounds: tuple[float, float, float, float]) -> tuple[float, float, float, float]:
+    """Move the western edge into [-180, 180) and the eastern edge east of it, covering all longitudes if the box
+    spans 360° or more."""
+    west, south, east, north = bounds
+    if east < west:
+        east += 360
+    if east - west >= 360:
+        return -180.0, south, 180.0, north
+    shift = 360 * math.floor((west + 180) / 360)
+    return west - shift, south, east - shift, north
+
+
+def circle_bounds(lon: float, lat: float, radius: float) -> tuple[float, float, float, float]:
+    """Return the bounding box (west, south, east, north) of a circle with a radius in meters, in degrees.
+
+    A circle crossing the antimeridian extends beyond 180° in the east, a circle enclosing a pole covers all
+    longitudes.
+    """
+    dlat = math.degrees(radius / EARTH_RADIUS)
+    south, north = max(-90.0, lat - dlat), min(90.0, lat + dlat)
+    cos_lat = math.cos(math.radians(lat))
+    if abs(lat) + dlat >= 90 or cos_lat < 1e-9:
+        return -180.0, south, 180.0, north
+    dlon = min(180.0, dlat / cos_lat)
+    return _normalize_bounds((lon - dlon, south, lon + dlon, north))
+
+
+def _iter_lines(coordinates: Any) -> Iterator[Any]:
+    """Yield the innermost position arrays (points, lines and rings) of a GeoJSON coordinate array."""
+    if not coordinates:
+        return
+    if not isinstance(coordinates[0], (list, tuple)):
+        yield [coordinates]
+    elif not isinstance(coordinates[0][0], (list, tuple)):
+        yield coordinates
+    else:
+        for item in coordinates:
+            yield from _iter_lines(item)
+
+
+def _line_bounds(positions: Any) -> tuple[float, float, float, float]:
+    """Return the bounding box of a sequence of positions connected by their shortest paths in longitude.
+
+    A closed ring winding around a pole is extended to that pole and covers all longitudes.
+    """
+    west = east = positions[0][0]
+    offset = 0.0
+    for previous, position in zip(positions[:-1], positions[1:]):
+        step = position[0] - previous[0]
+        if step > 180:
+            offset -= 360
+        elif step < -180:
+            offset += 360
+        west, east = min(west, position[0] + offset), max(east, position[0] + offset)
+    latitudes = [position[1] for position in positions]
+    south, north = min(latitudes), max(latitudes)
+    if offset and positions[0][:2] == positions[-1][:2]:
+        if sum(latitudes) > 0:
+            north = 90.0
+        else:
+            south = -90.0
+        return -180.0, south, 180.0, north
+    return _normalize_bounds((west, south, east, north))
+
+
+def coordinate_bounds(coordinates: Any) -> tuple[float, float, float, float] | None:
+    """Return the bounding box (west, south, east, north) of an arbitrarily nested GeoJSON coordinate array, or None
+    if it holds no positions."""
+    return merge_bounds(_line_bounds(line) for line in _iter_lines(coordinates))
+
+
+def merge_bounds(
+    bounds: Iterable[tuple[float, float, float, float] | None],
+) -> tuple[float, float, float, float] | None:
+    """Return the smallest bounding box containing all given bounding boxes, or None if there are none.
+
+    Bounding boxes crossing the antimeridian have a western edge in [-180, 180) and an eastern edge beyond 180°
+    (an eastern edge smaller than the western edge is accepted as well). The result uses the same form, it is
+    the complement of the largest longitude gap left by all boxes, so boxes on either side of the antimeridian are
+    merged across it. None entries (empty geometries) are skipped.
+    """
+    south = math.inf
+    north = -math.inf
+    arcs: list[tuple[float, float]] = []
+    for box in bounds:
+        if box is None:
+            continue
+        west, box_south, east, box_north = box
+        south, north = min(south, box_south), max(north, box_north)
+        west, _, east, _ = _normalize_bounds((west, box_south, east, box_north))
+        if east > 180:
+            arcs += [(west, 180.0), (-180.0, east - 360)]
+        else:
+            arcs.append((west, east))
+    if not arcs:
+        return None
+
+    arcs.sort()
+    merged = [list(arcs[0])]
+    for west, east in arcs[1:]:
+        if west <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], east)
+        else:
+            merged.append([west, east])
+    # gaps between consecutive arcs as (start, end), including the gap across the antimeridian
+    gaps = [(a[1], b[0]) for a, b in zip(merged[:-1], merged[1:])]
+    gap_start, gap_end = max(gaps, key=lambda gap: gap[1] - gap[0], default=(0.0, 0.0))
+    if merged[0][0] + 360 - merged[-1][1] >= gap_end - gap_start:
+        return merged[0][0], south, merged[-1][1], north
+    return gap_end, south, gap_start + 360, north
+
+
+def bounds_intersect(a: tuple[float, float, float, float], b: tuple[float, float, float, float]) -> bool:
+    """Test whether two bounding boxes intersect, taking bounding boxes crossing the antimeridian into account."""
+    a_west, a_south, a_east, a_north = _normalize_bounds(a)
+    b_west, b_south, b_east, b_north = _normalize_bounds(b)
+    if a_south > b_north or a_north < b_south:
+        return False
+    return any(a_west + shift <= b_east and a_east + shift >= b_west for shift in (-360, 0, 360))
+
+
+def geometry_bounds(geometry: Geometry) -> tuple[float, float, float, float] | None:
+    """Return the horizontal bounding box (west, south, east, north) of a geometry in degrees, or None for empty
+    geometries (a GeometryCollection without any geometries).
+
+    The circular extent of Point geometries is taken into account. Positions are connected along their shortest
+    path in longitude, so a geometry crossing the antimeridian has an eastern edge beyond 180°, see `merge_bounds`.
+    """
+    return merge_bounds(
+        circle_bounds(item.coordinates[0], item.coordinates[1], item.extent.radius)
+        if isinstance(item, Point) and item.extent is not None
+        else coordinate_bounds(item.coordinates)
+        for item, _ in flatten_geometry(geometry)
+    )
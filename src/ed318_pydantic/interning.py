@@ -0,0 +1,143 @@
+"""
+Deduplication of repeated sub-objects across UAS Geographical Zones
+
+Large data sets repeat the same authorities, texts, schedules and vertical layers across thousands of zones.
+Interning replaces all identical copies with one shared, immutable instance, which reduces memory usage and
+lets equal sub-objects be grouped by identity.
+"""
+
+import sys
+from datetime import datetime, time
+from typing import Any, NoReturn, TypeVar
+
+from pydantic import BaseModel
+
+from .geometries import VerticalLayer
+from .models import Authority, DailyPeriod, FeatureCollection, TimePeriod
+from .types import TextLongType, TextShortType
+
+T = TypeVar("T")
+
+
+class FrozenList(list[T]):
+    """Immutable, hashable list, used for the list fields of interned models.
+
+    Being a list, it is serialized like any other list field.
+    """
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __reduce__(self) -> tuple[type, tuple[list[T]]]:
+        # copy and pickle would otherwise rebuild the list through the blocked `extend`
+        return type(self), (list(self),)
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError("interned lists are shared between zones and cannot be modified")
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _immutable
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+
+
+class FrozenTextShortType(TextShortType, frozen=True):
+    """Immutable TextShortType, shared between zones after interning."""
+
+
+class FrozenTextLongType(TextLongType, frozen=True):
+    """Immutable TextLongType, shared between zones after interning."""
+
+
+class FrozenAuthority(Authority, frozen=True):
+    """Immutable Authority, shared between zones after interning."""
+
+
+class FrozenDailyPeriod(DailyPeriod, frozen=True):
+    """Immutable DailyPeriod, shared between zones after interning."""
+
+
+class FrozenTimePeriod(TimePeriod, frozen=True):
+    """Immutable TimePeriod, shared between zones after interning."""
+
+
+class FrozenVerticalLayer(VerticalLayer, frozen=True):
+    """Immutable VerticalLayer, shared between zones after interning."""
+
+
+frozen_variants: dict[type[BaseModel], type[BaseModel]] = {
+    TextShortType: FrozenTextShortType,
+    TextLongType: FrozenTextLongType,
+    Authority: FrozenAuthority,
+    DailyPeriod: FrozenDailyPeriod,
+    TimePeriod: FrozenTimePeriod,
+    VerticalLayer: FrozenVerticalLayer,
+}
+frozen_variants.update({frozen: frozen for frozen in list(frozen_variants.values())})
+
+_skipped_fields = {"coordinates", "bbox"}
+"""Fields holding plain numbers that are not worth traversing."""
+
+
+class Interner:
+    """Pool of interned strings and immutable sub-models.
+
+    Sub-models with a frozen variant are replaced by a single shared frozen instance per distinct value, all
+    other models are updated in place. Nested sub-models are interned first, so that a pooled model can be
+    looked up by the identity of its children instead of comparing deep structures.
+
+    List fields of pooled models hold FrozenLists, so that pooled models are hashable and cannot be modified
+    through their fields. Note that frozen variants do not compare equal to instances of their mutable base class.
+    """
+
+    def __init__(self):
+        self._pool: dict[tuple, BaseModel] = {}
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def intern(self, value: Any) -> Any:
+        """Return the interned equivalent of a value."""
+        if type(value) is str:
+            return sys.intern(value)
+        if isinstance(value, list):
+            return type(value)(self.intern(item) for item in value)
+        if not isinstance(value, BaseModel):
+            return value
+
+        fields = {
+            name: getattr(value, name) if name in _skipped_fields else self.intern(getattr(value, name))
+            for name in type(value).model_fields
+        }
+        frozen = frozen_variants.get(type(value))
+        if frozen is None:
+            # writing to __dict__ directly keeps model_fields_set untouched
+            value.__dict__.update(fields)
+            return value
+
+        key = (frozen, *(_key(item) for item in fields.values()))
+        if key not in self._pool:
+            fields = {name: FrozenList(item) if isinstance(item, list) else item for name, item in fields.items()}
+            self._pool[key] = frozen.model_construct(_fields_set=value.model_fields_set, **fields)
+        return self._pool[key]
+
+
+def _key(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        # nested sub-models have already been interned and are kept alive by the pool
+        return id(value)
+    if isinstance(value, list):
+        return tuple(_key(item) for item in value)
+    if isinstance(value, (datetime, time)):
+        # equal instants with different UTC offsets are serialized differently
+        return type(value), value, value.tzinfo
+    # equal values of different types (e.g. 120 and 120.0) are serialized differently
+    return type(value), value
+
+
+def deduplicate(collection: FeatureCollection, interner: Interner | None = None) -> FeatureCollection:
+    """Intern all strings and repeated sub-models of a FeatureCollection in place.
+
+    Pass the same Interner to deduplicate across several collections.
+    """
+    if interner is None:
+        interner = Interner()
+    return interner.intern(collection)
@@ -1,3 +1,4 @@
+from datetime import UTC, date, datetime, time, tzinfo
 from typing import Annotated, Any
 
 import geojson_pydantic as geojson
@@ -24,6 +25,17 @@ from .types import (
 )
 from .util import CoercedList, CoercedOptional, convert_to_list
 
+_weekdays = ("MON", "TUE", "WED", "THU", "FRI", "SAT", "SUN")
+
+
+def _to_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def _local_time(value: time, zone: tzinfo) -> time:
+    """Return a time of day as naive time in the given zone; naive times are taken as UTC."""
+    return datetime.combine(date(2000, 1, 1), value, value.tzinfo or UTC).astimezone(zone).time()
+
 
 class DailyPeriod(BaseModel):
     """ED-318 4.2.4.4 DailyPeriod
@@ -45,6 +57,29 @@ class DailyPeriod(BaseModel):
             raise ValueError("endTime and endEvent cannot be present simultaneously")
         return self
 
+    def applies_at(self, at: datetime) -> bool:
+        """Check whether this schedule applies at a given instant; naive datetimes and times are taken as UTC.
+
+        Weekdays and times are evaluated in the time zone of the schedule's startTime (or endTime). Daylight events
+        cannot be resolved without a solar model, periods starting or ending with one are considered to apply all
+        day.
+        """
+        reference = self.startTime or self.endTime
+        zone = reference.tzinfo if reference is not None and reference.tzinfo is not None else UTC
+        at = _to_utc(at).astimezone(zone)
+        if "ANY" not in self.day and _weekdays[at.weekday()] not in self.day:
+            return False
+        if self.startEvent or self.endEvent:
+            return True
+        start = _local_time(self.startTime, zone) if self.startTime else time.min
+        now = at.time()
+        if self.endTime is None:
+            return now >= start
+        end = _local_time(self.endTime, zone)
+        if start <= end:
+            return start <= now < end
+        return now >= start or now < end
+
 
 class TimePeriod(BaseModel):
     """ED-318 4.2.4.3 TimePeriod
@@ -56,6 +91,15 @@ class TimePeriod(BaseModel):
     endDateTime: CoercedOptional[DateTimeType] = None
     schedule: CoercedOptional[list[DailyPeriod]] = None
 
+    def applies_at(self, at: datetime) -> bool:
+        """Check whether this period applies at a given instant; naive datetimes are taken as UTC."""
+        at = _to_utc(at)
+        if self.startDateTime and at < _to_utc(self.startDateTime):
+            return False
+        if self.endDateTime and at > _to_utc(self.endDateTime):
+            return False
+        return self.schedule is None or any(period.applies_at(at) for period in self.schedule)
+
 
 class DatasetMetadata(BaseModel):
     """ED-318 4.2.4.1 DatasetMetadata
@@ -127,6 +171,10 @@ class UASZone(BaseModel):
     zoneAuthority: Annotated[list[Authority], Field(min_length=1)]
     dataSource: CoercedOptional[Metadata] = None
 
+    def applies_at(self, at: datetime) -> bool:
+        """Check whether the zone applies at a given instant, according to its limitedApplicability."""
+        return self.limitedApplicability is None or any(period.applies_at(at) for period in self.limitedApplicability)
+
 
 class Feature(geojson.Feature):
     geometry: Geometry
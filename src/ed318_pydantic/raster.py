@@ -0,0 +1,173 @@
+"""
+Rasterization of UAS Geographical Zones into restriction grids
+
+Produces per altitude band bitmask and priority grids of a FeatureCollection, e.g. for route planning.
+Requires the optional `numpy` dependency.
+"""
+
+import math
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import NamedTuple
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError("ed318_pydantic.raster requires numpy, install ed318-pydantic[numpy]") from e
+
+from .containment import Circle, RingSet
+from .geometries import MultiPolygon, Point, Polygon, flatten_geometry, layer_limits
+from .models import FeatureCollection
+
+ZONE_TYPES = ("NO_RESTRICTION", "USPACE", "CONDITIONAL", "REQ_AUTHORIZATION", "PROHIBITED")
+"""All CodeZoneType values in ascending order of restriction. A zone type's index is its bit in the bitmask grid,
+its index + 1 its value in the priority grid."""
+
+
+def altitude_bands(collection: FeatureCollection) -> list[tuple[float, float]]:
+    """Derive altitude bands from all distinct layer limits of a FeatureCollection."""
+    limits = sorted(
+        {
+            limit
+            for feature in collection.features
+            for _, layer in flatten_geometry(feature.geometry)
+            for limit in layer_limits(layer)
+        }
+    )
+    return list(zip(limits[:-1], limits[1:]))
+
+
+class ZoneRaster(NamedTuple):
+    """Restriction grids of a FeatureCollection.
+
+    Row 0 is the northernmost row, column 0 the westernmost column. Grids are indexed as [band, row, column].
+    """
+
+    bounds: tuple[float, float, float, float]
+    """Outer bounds (west, south, east, north) of the grid in degrees."""
+    cell_size: float
+    """Edge length of a cell in degrees."""
+    bands: list[tuple[float, float]]
+    """Altitude bands (lower, upper) in meters."""
+    mask: np.ndarray
+    """Bitmask of the zone types covering each cell, see ZONE_TYPES."""
+    priority: np.ndarray
+    """Most restrictive zone type covering each cell, as index into ZONE_TYPES + 1, or 0 if not covered."""
+
+    def zone_type_mask(self, zone_type: str) -> np.ndarray:
+        """Return a boolean grid of the cells covered by zones of the given type."""
+        return (self.mask & (1 << ZONE_TYPES.index(zone_type))) != 0
+
+
+class _Part(NamedTuple):
+    shape: RingSet | Circle
+    bands: np.ndarray
+    bit: int
+
+
+def _fill(part: _Part, raster: ZoneRaster, rows: tuple[int, int], columns: tuple[int, int], shift: float) -> None:
+    """Rasterize one zone part, shifted by a multiple of 360° in longitude, into a tile of the grid."""
+    west, _, _, north = raster.bounds
+    cell = raster.cell_size
+    first_row, last_row = rows
+    first_column, last_column = columns
+    n_rows, n_columns = last_row - first_row, last_column - first_column
+    lon = west + (np.arange(first_column, last_column) + 0.5) * cell
+    lat = north - (np.arange(first_row, last_row) + 0.5) * cell
+
+    if isinstance(part.shape, RingSet):
+        # a cell lies within the rings if an odd number of crossings of its row lies west of its center
+        row, x = part.shape.crossings(lat)
+        column = np.clip(np.ceil((x + shift - west) / cell - 0.5), first_column, last_column) - first_column
+        toggles = np.bincount(row * (n_columns + 1) + column.astype(np.intp), minlength=n_rows * (n_columns + 1))
+        tile = np.cumsum(toggles.reshape(n_rows, n_columns + 1)[:, :-1], axis=1) % 2 == 1
+    else:
+        tile = part.shape.contains(lon[None, :] - shift, lat[:, None])
+
+    if not tile.any():
+        return
+    window = (slice(first_row, last_row), slice(first_column, last_column))
+    for band in part.bands:
+        mask, priority = raster.mask[band][window], raster.priority[band][window]
+        mask[tile] |= np.uint8(1 << part.bit)
+        priority[tile] = np.maximum(priority[tile], np.uint8(part.bit + 1))
+
+
+def rasterize(
+    collection: FeatureCollection,
+    bounds: tuple[float, float, float, float],
+    cell_size: float,
+    bands: Sequence[tuple[float, float]] | None = None,
+    tile_size: int = 256,
+    max_workers: int | None = None,
+    at: datetime | None = None,
+) -> ZoneRaster:
+    """Rasterize all zones of a FeatureCollection into bitmask and priority grids.
+
+    A cell is covered by a zone if its center lies within the zone, using scanline filling for polygons. A zone is
+    assigned to every altitude band its VerticalLayer overlaps; bands default to `altitude_bands(collection)`.
+    Zones without an area (LineStrings and Points without extent) are ignored, as are zones not applying `at` a
+    given instant, see `UASZone.applies_at`. The grid is split into tiles of
+    `tile_size` cells squared, which are rasterized on a thread pool. Each zone part is filled into the window of
+    a tile covered by its bounding box with a few vectorized NumPy operations, computing all scanlines at once.
+
+    Grids crossing the antimeridian are given with an eastern edge beyond 180° or west of the western edge (see
+    `merge_bounds`); their columns continue eastwards across it.
+    """
+    west, south, east, north = bounds
+    if east < west:
+        east += 360
+    n_columns = math.ceil((east - west) / cell_size)
+    n_rows = math.ceil((north - south) / cell_size)
+    bands = list(bands) if bands is not None else altitude_bands(collection)
+    band_lower = np.asarray([lower for lower, _ in bands], dtype=float)
+    band_upper = np.asarray([upper for _, upper in bands], dtype=float)
+
+    raster = ZoneRaster(
+        bounds=(west, north - n_rows * cell_size, west + n_columns * cell_size, north),
+        cell_size=cell_size,
+        bands=bands,
+        mask=np.zeros((len(bands), n_rows, n_columns), dtype=np.uint8),
+        priority=np.zeros((len(bands), n_rows, n_columns), dtype=np.uint8),
+    )
+
+    parts: list[_Part] = []
+    for feature in collection.features:
+        if at is not None and not feature.properties.applies_at(at):
+            continue
+        bit = ZONE_TYPES.index(feature.properties.type)
+        for geometry, layer in flatten_geometry(feature.geometry):
+            lower, upper = layer_limits(layer)
+            layer_bands = np.flatnonzero((band_lower < upper) & (band_upper > lower))
+            if isinstance(geometry, (Polygon, MultiPolygon)):
+                parts.append(_Part(RingSet(geometry), layer_bands, bit))
+            elif isinstance(geometry, Point) and geometry.extent is not None:
+                parts.append(_Part(Circle(geometry), layer_bands, bit))
+
+    def rasterize_tile(rows: tuple[int, int], columns: tuple[int, int]) -> None:
+        first_row, last_row = rows
+        first_column, last_column = columns
+        for part in parts:
+            if not len(part.bands):
+                continue
+            # only the cells of the tile within the bounding box of the part are filled
+            part_west, part_south, part_east, part_north = part.shape.bounds
+            top = max(first_row, math.floor((north - part_north) / cell_size))
+            bottom = min(last_row, math.ceil((north - part_south) / cell_size))
+            # parts and grids may extend beyond 180°, so a part overlaps the tile directly or shifted by 360°
+            for shift in (-360.0, 0.0, 360.0):
+                left = max(first_column, math.floor((part_west + shift - west) / cell_size))
+                right = min(last_column, math.ceil((part_east + shift - west) / cell_size))
+                if top < bottom and left < right:
+                    _fill(part, raster, (top, bottom), (left, right), shift)
+
+    tiles = [
+        ((r, min(r + tile_size, n_rows)), (c, min(c + tile_size, n_columns)))
+        for r in range(0, n_rows, tile_size)
+        for c in range(0, n_columns, tile_size)
+    ]
+    with ThreadPoolExecutor(max_workers) as executor:
+        for result in [executor.submit(rasterize_tile, rows, columns) for rows, columns in tiles]:
+            result.result()
+    return raster
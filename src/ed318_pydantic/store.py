@@ -0,0 +1,254 @@
+"""
+Live store for dynamic UAS Geographical Zones
+
+Keeps a set of zones current through single-feature upserts and deletes, e.g. for EMERGENCY and DAR zones
+changing on a minutes timescale, and publishes every change to asyncio subscribers.
+"""
+
+import asyncio
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from types import MappingProxyType
+from typing import Any, Literal, NamedTuple, Self, TypeVar, cast
+
+from pydantic import BaseModel
+
+from .geometries import geometry_bounds
+from .models import Feature
+
+V = TypeVar("V")
+
+_BITS = 5
+"""Hash bits consumed per level of a _PersistentMap trie."""
+_WIDTH = 1 << _BITS
+_LEAF_SIZE = 32
+"""Maximum number of entries of a _PersistentMap leaf before it is split into a branch."""
+_HASH_BITS = 64
+
+
+def _hash(key: str) -> int:
+    return hash(key) & ((1 << _HASH_BITS) - 1)
+
+
+class _PersistentMap(Mapping[str, V]):
+    """Immutable mapping whose updates share all untouched entries with their predecessor.
+
+    Entries are stored in a hash trie: branches are tuples of 32 children selected by 5 bits of the key hash,
+    leaves are dicts of up to 32 entries. `set` and `remove` only copy the path to the changed leaf, O(log n).
+    """
+
+    __slots__ = ("_root", "_len")
+
+    def __init__(self, items: Mapping[str, V] | None = None):
+        entries = dict(items or {})
+        self._root = self._build(list(entries.items()), 0)
+        self._len = len(entries)
+
+    @classmethod
+    def _build(cls, items: list[tuple[str, V]], shift: int) -> Any:
+        if len(items) <= _LEAF_SIZE or shift >= _HASH_BITS:
+            return dict(items)
+        groups: list[list[tuple[str, V]]] = [[] for _ in range(_WIDTH)]
+        for item in items:
+            groups[(_hash(item[0]) >> shift) % _WIDTH].append(item)
+        return tuple(cls._build(group, shift + _BITS) for group in groups)
+
+    @classmethod
+    def _from_root(cls, root: Any, length: int) -> Self:
+        result = cls.__new__(cls)
+        result._root, result._len = root, length
+        return result
+
+    def __getitem__(self, key: str) -> V:
+        node, h = self._root, _hash(key)
+        while isinstance(node, tuple):
+            node, h = node[h % _WIDTH], h >> _BITS
+        return node[key]
+
+    def __iter__(self) -> Iterator[str]:
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, tuple):
+                stack.extend(node)
+            else:
+                yield from node
+
+    def __len__(self) -> int:
+        return self._len
+
+    def set(self, key: str, value: V) -> Self:
+        """Return a copy of this mapping with `key` set to `value`."""
+        added = key not in self
+        return self._from_root(self._set(self._root, key, value, _hash(key), 0), self._len + added)
+
+    def remove(self, key: str) -> Self:
+        """Return a copy of this mapping without `key`, raising a KeyError if it is missing."""
+        if key not in self:
+            raise KeyError(key)
+        return self._from_root(self._remove(self._root, key, _hash(key), 0), self._len - 1)
+
+    @classmethod
+    def _set(cls, node: Any, key: str, value: V, h: int, shift: int) -> Any:
+        if isinstance(node, dict):
+            leaf = node | {key: value}
+            return cls._build(list(leaf.items()), shift) if len(leaf) > _LEAF_SIZE else leaf
+        i = (h >> shift) % _WIDTH
+        return node[:i] + (cls._set(node[i], key, value, h, shift + _BITS),) + node[i + 1 :]
+
+    @classmethod
+    def _remove(cls, node: Any, key: str, h: int, shift: int) -> Any:
+        if isinstance(node, dict):
+            return {k: v for k, v in node.items() if k != key}
+        i = (h >> shift) % _WIDTH
+        children = node[:i] + (cls._remove(node[i], key, h, shift + _BITS),) + node[i + 1 :]
+        # collapse branches that fit into a single leaf again
+        if all(isinstance(child, dict) for child in children) and sum(map(len, children)) <= _LEAF_SIZE:
+            return {k: v for child in children for k, v in child.items()}
+        return children
+
+
+class ZoneChange(BaseModel):
+    """A change of a single zone in a ZoneStore."""
+
+    version: int
+    """Store version after the change has been applied."""
+    action: Literal["upsert", "delete"]
+    identifier: str
+    feature: Feature | None = None
+    """The new feature, None for deletions."""
+
+
+class ZoneSnapshot(NamedTuple):
+    """Immutable, consistent view of a ZoneStore at a given version."""
+
+    version: int
+    features: Mapping[str, Feature]
+    """Features by zone identifier."""
+    bounds: Mapping[str, tuple[float, float, float, float]]
+    """Bounding boxes (west, south, east, north) by zone identifier, omitting zones with empty geometries."""
+    by_type: Mapping[str, Mapping[str, Feature]]
+    """Features by CodeZoneType and zone identifier."""
+
+
+class ZoneStore:
+    """Store of UAS Geographical Zones supporting incremental updates.
+
+    Every update replaces the current ZoneSnapshot as a whole (copy-on-write), so `snapshot()` is a single
+    attribute read and readers never observe a partially applied update. Snapshots are built from persistent
+    mappings that share all unchanged entries with their predecessor, so an update only recomputes the derived
+    index entries of the changed zone and costs O(log n) in the number of zones.
+    """
+
+    def __init__(self, features: Iterable[Feature] = ()):
+        self._lock = threading.Lock()
+        self._subscribers: list[tuple[asyncio.AbstractEventLoop, asyncio.Queue[ZoneChange]]] = []
+        by_identifier = {feature.properties.identifier: feature for feature in features}
+        by_type: dict[str, dict[str, Feature]] = {}
+        for identifier, feature in by_identifier.items():
+            by_type.setdefault(feature.properties.type, {})[identifier] = feature
+        self._snapshot = ZoneSnapshot(
+            0,
+            _PersistentMap(by_identifier),
+            _PersistentMap(
+                {
+                    identifier: bounds
+                    for identifier, feature in by_identifier.items()
+                    if (bounds := geometry_bounds(feature.geometry)) is not None
+                }
+            ),
+            MappingProxyType({zone_type: _PersistentMap(features) for zone_type, features in by_type.items()}),
+        )
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def __len__(self) -> int:
+        return len(self._snapshot.features)
+
+    def __contains__(self, identifier: object) -> bool:
+        return identifier in self._snapshot.features
+
+    def get(self, identifier: str) -> Feature | None:
+        return self._snapshot.features.get(identifier)
+
+    def snapshot(self) -> ZoneSnapshot:
+        """Return a consistent view of all zones and indexes, unaffected by later updates."""
+        return self._snapshot
+
+    def upsert(self, feature: Feature | dict[str, Any] | str | bytes) -> ZoneChange:
+        """Insert or replace a zone, validating raw input as a Feature."""
+        if isinstance(feature, (str, bytes)):
+            feature = Feature.model_validate_json(feature)
+        elif not isinstance(feature, Feature):
+            feature = Feature.model_validate(feature)
+        return self._apply(feature.properties.identifier, feature, geometry_bounds(feature.geometry))
+
+    def delete(self, identifier: str) -> ZoneChange:
+        """Remove a zone, raising a KeyError for unknown identifiers."""
+        return self._apply(identifier, None, None)
+
+    def subscribe(self) -> asyncio.Queue[ZoneChange]:
+        """Return a queue receiving all subsequent changes; must be called from within a running event loop."""
+        queue: asyncio.Queue[ZoneChange] = asyncio.Queue()
+        with self._lock:
+            self._subscribers.append((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[ZoneChange]) -> None:
+        with self._lock:
+            self._subscribers = [(loop, q) for loop, q in self._subscribers if q is not queue]
+
+    def _apply(
+        self, identifier: str, feature: Feature | None, feature_bounds: tuple[float, float, float, float] | None
+    ) -> ZoneChange:
+        with self._lock:
+            current = self._snapshot
+            features = cast(_PersistentMap[Feature], current.features)
+            bounds = cast(_PersistentMap[tuple[float, float, float, float]], current.bounds)
+            by_type = cast(dict[str, _PersistentMap[Feature]], dict(current.by_type))
+
+            previous = features.get(identifier)
+            if previous is None and feature is None:
+                raise KeyError(identifier)
+            if previous is not None:
+                features = features.remove(identifier)
+                if identifier in bounds:
+                    bounds = bounds.remove(identifier)
+                zone_type = previous.properties.type
+                remaining = by_type[zone_type].remove(identifier)
+                if remaining:
+                    by_type[zone_type] = remaining
+                else:
+                    del by_type[zone_type]
+
+            if feature is not None:
+                zone_type = feature.properties.type
+                features = features.set(identifier, feature)
+                if feature_bounds is not None:
+                    bounds = bounds.set(identifier, feature_bounds)
+                by_type[zone_type] = by_type.get(zone_type, _PersistentMap()).set(identifier, feature)
+
+            self._snapshot = ZoneSnapshot(current.version + 1, features, bounds, MappingProxyType(by_type))
+            change = ZoneChange(
+                version=current.version + 1,
+                action="delete" if feature is None else "upsert",
+                identifier=identifier,
+                feature=feature,
+            )
+            self._publish(change)
+        return change
+
+    def _publish(self, change: ZoneChange) -> None:
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        for loop, queue in self._subscribers:
+            if loop.is_closed():
+                continue
+            if loop is running_loop:
+                queue.put_nowait(change)
+            else:
+                loop.call_soon_threadsafe(queue.put_nowait, change)
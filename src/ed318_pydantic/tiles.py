@@ -0,0 +1,99 @@
+"""
+Quadkey tile partitioning of ED-318 data sets
+
+Splits a validated FeatureCollection into Web Mercator (Bing Maps quadkey) tiles, so that services sharded by
+geography only need to load the zones of their own region.
+"""
+
+import math
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from .geometries import geometry_bounds
+from .models import FeatureCollection
+
+MAX_LATITUDE = 85.05112878
+"""Latitude limit of the Web Mercator projection, zones beyond it are assigned to the outermost tiles."""
+
+
+def tile_xy(lon: float, lat: float, zoom: int) -> tuple[int, int]:
+    """Return the (x, y) tile coordinates containing a WGS84 position at the given zoom level."""
+    n = 1 << zoom
+    lat = min(max(lat, -MAX_LATITUDE), MAX_LATITUDE)
+    sin_lat = math.sin(math.radians(lat))
+    x = (lon + 180.0) / 360.0
+    y = 0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)
+    return min(max(int(x * n), 0), n - 1), min(max(int(y * n), 0), n - 1)
+
+
+def quadkey(x: int, y: int, zoom: int) -> str:
+    """Return the quadkey of a tile."""
+    digits = []
+    for i in range(zoom, 0, -1):
+        mask = 1 << (i - 1)
+        digits.append(str((1 if x & mask else 0) + (2 if y & mask else 0)))
+    return "".join(digits)
+
+
+def tiles_for_bounds(bounds: tuple[float, float, float, float], zoom: int) -> list[str]:
+    """Return the quadkeys of all tiles touched by a (west, south, east, north) bounding box.
+
+    Bounding boxes crossing the antimeridian, with an eastern edge beyond 180° or west of the western edge (see
+    `merge_bounds`), touch the tiles on both sides of it.
+    """
+    west, south, east, north = bounds
+    width = east - west if east >= west else east - west + 360
+    west = (west + 180) % 360 - 180
+    x_min, y_min = tile_xy(west, north, zoom)
+    x_max, y_max = tile_xy(west + width - 360 if west + width > 180 else west + width, south, zoom)
+    n = 1 << zoom
+    if width >= 360:
+        columns = list(range(n))
+    elif west + width > 180:
+        columns = list(dict.fromkeys([*range(x_min, n), *range(x_max + 1)]))
+    else:
+        columns = list(range(x_min, x_max + 1))
+    return [quadkey(x, y, zoom) for y in range(y_min, y_max + 1) for x in columns]
+
+
+def partition(collection: FeatureCollection, zoom: int) -> dict[str, FeatureCollection]:
+    """Split a FeatureCollection into one FeatureCollection per quadkey tile.
+
+    Zones are assigned to every tile touched by their bounding box (including circle extents), so a zone
+    spanning several tiles is contained in all of them. Zones with empty geometries touch no tile and are
+    dropped. Tiles without any zone are omitted. Every tile keeps the name and DatasetMetadata of the original
+    collection.
+    """
+    tiles: dict[str, list] = {}
+    for feature in collection.features:
+        bounds = geometry_bounds(feature.geometry)
+        if bounds is None:
+            continue
+        for key in tiles_for_bounds(bounds, zoom):
+            tiles.setdefault(key, []).append(feature)
+    return {key: collection.model_copy(update={"features": features}) for key, features in sorted(tiles.items())}
+
+
+class TileManifest(BaseModel):
+    """Mapping of quadkey tiles to the files holding their zones."""
+
+    zoom: int = Field(ge=1, le=23)
+    tiles: dict[str, str] = {}
+    """Tile files by quadkey, relative to the manifest."""
+
+    def files_for_bounds(self, bounds: tuple[float, float, float, float]) -> list[str]:
+        """Return the files a worker responsible for the given bounding box has to load."""
+        return [self.tiles[key] for key in tiles_for_bounds(bounds, self.zoom) if key in self.tiles]
+
+
+def write_partitions(collection: FeatureCollection, directory: Path, zoom: int) -> TileManifest:
+    """Partition a FeatureCollection and write one ED-318 file per tile, plus a `manifest.json`, to a directory."""
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest = TileManifest(zoom=zoom)
+    for key, tile in partition(collection, zoom).items():
+        filename = f"{key}.json"
+        (directory / filename).write_text(tile.model_dump_json(exclude_none=True))
+        manifest.tiles[key] = filename
+    (directory / "manifest.json").write_text(manifest.model_dump_json(indent=2))
+    return manifest
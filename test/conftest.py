@@ -1,3 +1,6 @@
+from collections.abc import Sequence
+from typing import Any
+
 import pytest
 
 
@@ -17,3 +20,40 @@ def pytest_collection_modifyitems(config, items):
     for item in items:
         if "slow" in item.keywords:
             item.add_marker(skip_slow)
+
+
+# builders for raw ED-318 test geometries and features, validated by the tests as needed
+
+
+def vertical_layer(lower: float = 0, upper: float = 120, uom: str = "m") -> dict[str, Any]:
+    return {"lower": lower, "lowerReference": "AGL", "upper": upper, "upperReference": "AGL", "uom": uom}
+
+
+def ring(west: float, south: float, east: float, north: float) -> list[list[float]]:
+    """A closed rectangular ring."""
+    return [[west, south], [east, south], [east, north], [west, north], [west, south]]
+
+
+def polygon(*rings: Sequence[Sequence[float]], layer: dict[str, Any] | None = None) -> dict[str, Any]:
+    coordinates = [[list(position) for position in ring] for ring in rings]
+    return {"type": "Polygon", "coordinates": coordinates, "layer": layer or vertical_layer()}
+
+
+def circle(lon: float, lat: float, radius: float, layer: dict[str, Any] | None = None) -> dict[str, Any]:
+    extent = {"subType": "Circle", "radius": radius}
+    return {"type": "Point", "coordinates": [lon, lat], "extent": extent, "layer": layer or vertical_layer()}
+
+
+def zone(identifier: str, geometry: dict[str, Any], zone_type: str = "PROHIBITED", **properties) -> dict[str, Any]:
+    return {
+        "type": "Feature",
+        "geometry": geometry,
+        "properties": {
+            "identifier": identifier,
+            "country": "DEU",
+            "type": zone_type,
+            "variant": "COMMON",
+            "zoneAuthority": [{"purpose": "INFORMATION"}],
+        }
+        | properties,
+    }
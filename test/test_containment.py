@@ -0,0 +1,143 @@
+import math
+
+import pytest
+from conftest import circle, polygon, ring
+
+np = pytest.importorskip("numpy")
+
+from ed318_pydantic.containment import METERS_PER_DEGREE, Circle, RingSet, ZoneIndex  # noqa: E402
+from ed318_pydantic.geometries import MultiPolygon, Point, Polygon  # noqa: E402
+
+antimeridian = [[170, -10], [-170, -10], [-170, 10], [170, 10], [170, -10]]
+
+
+@pytest.mark.parametrize(
+    "rings, point, expected",
+    [
+        # simple square
+        ([ring(0, 0, 1, 1)], (0.5, 0.5), True),
+        ([ring(0, 0, 1, 1)], (1.5, 0.5), False),
+        ([ring(0, 0, 1, 1)], (0.5, -0.5), False),
+        # square with hole
+        ([ring(0, 0, 4, 4), ring(1, 1, 2, 2)], (1.5, 1.5), False),
+        ([ring(0, 0, 4, 4), ring(1, 1, 2, 2)], (3, 3), True),
+        # concave polygon
+        ([[(0, 0), (4, 0), (4, 4), (2, 1), (0, 4), (0, 0)]], (2, 2), False),
+        ([[(0, 0), (4, 0), (4, 4), (2, 1), (0, 4), (0, 0)]], (2, 0.5), True),
+        # crossing the antimeridian
+        ([antimeridian], (175, 0), True),
+        ([antimeridian], (-175, 0), True),
+        ([antimeridian], (180, 0), True),
+        ([antimeridian], (0, 0), False),
+        ([antimeridian], (160, 0), False),
+        ([antimeridian], (-160, 0), False),
+        # antimeridian with a hole on the other side
+        ([antimeridian, ring(-176, -1, -174, 1)], (-175, 0), False),
+        ([antimeridian, ring(-176, -1, -174, 1)], (175, 0), True),
+        # cap around the north pole
+        ([[(0, 80), (90, 80), (180, 80), (-90, 80), (0, 80)]], (45, 85), True),
+        ([[(0, 80), (90, 80), (180, 80), (-90, 80), (0, 80)]], (-135, 89), True),
+        ([[(0, 80), (90, 80), (180, 80), (-90, 80), (0, 80)]], (45, 75), False),
+        # cap around the south pole
+        ([[(0, -80), (-90, -80), (180, -80), (90, -80), (0, -80)]], (10, -85), True),
+        ([[(0, -80), (-90, -80), (180, -80), (90, -80), (0, -80)]], (10, 85), False),
+    ],
+)
+def test_polygon_contains(rings: list, point: tuple[float, float], expected: bool):
+    lon, lat = point
+    assert bool(RingSet(Polygon.model_validate(polygon(*rings))).contains(lon, lat)) is expected
+
+
+def test_multipolygon_contains():
+    geometry = MultiPolygon.model_validate(
+        polygon(ring(0, 0, 1, 1)) | {"type": "MultiPolygon", "coordinates": [[ring(0, 0, 1, 1)], [ring(2, 0, 3, 1)]]}
+    )
+    result = RingSet(geometry).contains([0.5, 1.5, 2.5], [0.5, 0.5, 0.5])
+    assert result.tolist() == [True, False, True]
+
+
+def test_boundary_tolerance():
+    rings = RingSet(Polygon.model_validate(polygon(ring(0, 0, 1, 1))))
+    ten_meters = 10 / METERS_PER_DEGREE
+
+    assert bool(rings.contains(1 + ten_meters, 0.5)) is False
+    assert bool(rings.contains(1 + ten_meters, 0.5, tolerance=5)) is False
+    assert bool(rings.contains(1 + ten_meters, 0.5, tolerance=20)) is True
+    assert bool(rings.contains(0.5, 0, tolerance=1)) is True
+
+
+def test_circle_contains():
+    prepared = Circle(Point.model_validate(circle(2.636866, 50.122901, 3500)))
+    dlat = 1 / METERS_PER_DEGREE
+    assert prepared.contains([2.636866, 2.636866], [50.122901 + 3000 * dlat, 50.122901 + 4000 * dlat]).tolist() == [
+        True,
+        False,
+    ]
+
+
+@pytest.mark.parametrize(
+    "center, point, expected",
+    [
+        ((179.99, 10), (-179.99, 10), True),
+        ((179.99, 10), (179.95, 10), True),
+        ((179.99, 10), (-179.9, 10), False),
+        ((-179.99, 10), (179.99, 10), True),
+        ((0, 89.99), (180, 89.99), True),
+    ],
+)
+def test_circle_across_antimeridian(center: tuple[float, float], point: tuple[float, float], expected: bool):
+    lon, lat = point
+    zone = Point.model_validate(circle(center[0], center[1], 5000))
+    assert bool(Circle(zone).contains(lon, lat)) is expected
+    assert ZoneIndex([zone]).zones_containing(lon, lat) == ([0] if expected else [])
+
+
+def test_zone_index():
+    index = ZoneIndex(
+        [
+            Polygon.model_validate(polygon(ring(0, 0, 1, 1))),
+            Polygon.model_validate(polygon(ring(0.5, 0.5, 2, 2))),
+            Polygon.model_validate(polygon(antimeridian)),
+        ]
+    )
+    assert index.zones_containing(0.75, 0.75) == [0, 1]
+    assert index.zones_containing(0.25, 0.25) == [0]
+    assert index.zones_containing(-175, 5) == [2]
+    assert index.zones_containing(5, 5) == []
+
+
+def test_random_star_polygon():
+    rng = np.random.default_rng(318)
+    angles = np.sort(rng.uniform(0, 2 * math.pi, 50))
+    radii = rng.uniform(0.5, 1.0, 50)
+    vertices = [(float(r * math.cos(a)), float(r * math.sin(a))) for r, a in zip(radii, angles)]
+    lon, lat = rng.uniform(-1, 1, (2, 2_000))
+
+    # reference: a point of a star-shaped polygon is inside if it is closer to the center than the edge
+    # intersected by the ray from the center through the point
+    expected = np.zeros(lon.shape, dtype=bool)
+    for i, (x, y) in enumerate(zip(lon, lat)):
+        a = math.atan2(y, x) % (2 * math.pi)
+        j = int(np.searchsorted(angles, a)) % len(vertices)
+        (x0, y0), (x1, y1) = vertices[j - 1], vertices[j]
+        dx, dy = math.cos(a), math.sin(a)
+        edge_radius = (x0 * (y1 - y0) - y0 * (x1 - x0)) / (dx * (y1 - y0) - dy * (x1 - x0))
+        expected[i] = math.hypot(x, y) < edge_radius
+
+    result = RingSet(Polygon.model_validate(polygon([*vertices, vertices[0]]))).contains(lon, lat)
+    assert (result == expected).all()
+
+
+@pytest.mark.slow
+def test_many_points_against_many_edges():
+    rng = np.random.default_rng(318)
+    angles = np.linspace(0, 2 * math.pi, 1_000, endpoint=False)
+    positions = [(math.cos(a), math.sin(a)) for a in angles]
+    rings = RingSet(Polygon.model_validate(polygon([*positions, positions[0]])))
+    lon, lat = rng.uniform(-1.2, 1.2, (2, 100_000))
+
+    result = rings.contains(lon, lat)
+    # the 1000-gon deviates from the unit circle by less than 1e-5
+    radius = np.hypot(lon, lat)
+    assert result[radius < 0.9999].all()
+    assert not result[radius > 1].any()
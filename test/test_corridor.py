@@ -0,0 +1,90 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from conftest import circle, polygon, ring, vertical_layer, zone
+
+pytest.importorskip("numpy")
+
+from ed318_pydantic.containment import METERS_PER_DEGREE  # noqa: E402
+from ed318_pydantic.corridor import CorridorIndex, Waypoint  # noqa: E402
+from ed318_pydantic.models import Feature  # noqa: E402
+
+start_time = datetime(2025, 6, 2, 12, tzinfo=UTC)
+
+
+def corridor_index(*zones: dict[str, Any]) -> CorridorIndex:
+    return CorridorIndex([Feature.model_validate(feature) for feature in zones])
+
+
+def route(*points: tuple[float, float, float]) -> list[Waypoint]:
+    """Waypoints one hour apart."""
+    return [
+        Waypoint(lon=lon, lat=lat, altitude=altitude, time=start_time + timedelta(hours=i))
+        for i, (lon, lat, altitude) in enumerate(points)
+    ]
+
+
+def test_crossing_entry_and_exit():
+    index = corridor_index(zone("A", polygon(ring(0, 0, 0.1, 0.1))))
+    (crossing,) = index.crossings(route((-0.1, 0.05, 50), (0.2, 0.05, 50)), resolution=100)
+
+    assert crossing.identifier == "A"
+    assert crossing.entry.lon == pytest.approx(0, abs=1e-5)
+    assert crossing.exit.lon == pytest.approx(0.1, abs=1e-5)
+    assert abs(crossing.entry.time - (start_time + timedelta(hours=1 / 3))) < timedelta(seconds=1)
+    assert (crossing.entry_segment, crossing.exit_segment) == (0, 0)
+
+
+def test_crossing_spans_segments():
+    index = corridor_index(zone("A", polygon(ring(0, 0, 0.1, 0.1))), zone("B", polygon(ring(1, 1, 1.1, 1.1))))
+    (crossing,) = index.crossings(route((-0.1, 0.05, 50), (0.05, 0.05, 50), (0.05, 0.2, 50)))
+
+    assert (crossing.entry_segment, crossing.exit_segment) == (0, 1)
+    assert crossing.entry.lon == pytest.approx(0, abs=1e-5)
+    assert crossing.exit.lat == pytest.approx(0.1, abs=1e-5)
+
+
+def test_altitude_limits():
+    index = corridor_index(zone("A", polygon(ring(0, 0, 0.1, 0.1), layer=vertical_layer(0, 120))))
+    assert index.crossings(route((-0.1, 0.05, 150), (0.2, 0.05, 150))) == []
+
+    # climbing through the upper limit halfway through the zone
+    (crossing,) = index.crossings(route((0, 0.05, 0), (0.1, 0.05, 240)))
+    assert crossing.exit.altitude == pytest.approx(120, abs=0.1)
+    assert crossing.exit.lon == pytest.approx(0.05, abs=1e-5)
+
+    (crossing,) = index.crossings(route((-0.1, 0.05, 150), (0.2, 0.05, 150)), vertical_buffer=50)
+    assert crossing.entry.lon == pytest.approx(0, abs=1e-5)
+
+
+def test_horizontal_buffer():
+    index = corridor_index(zone("A", polygon(ring(0, 0, 0.1, 0.1))))
+    offset = 0.1 + 100 / METERS_PER_DEGREE
+    assert index.crossings(route((-0.1, offset, 50), (0.2, offset, 50))) == []
+    assert len(index.crossings(route((-0.1, offset, 50), (0.2, offset, 50)), buffer=200)) == 1
+
+
+def test_limited_applicability():
+    applicability = {"limitedApplicability": [{"endDateTime": (start_time + timedelta(minutes=30)).isoformat()}]}
+    index = corridor_index(zone("A", polygon(ring(0, 0, 0.1, 0.1)), **applicability))
+
+    (crossing,) = index.crossings(route((-0.1, 0.05, 50), (0.2, 0.05, 50)))
+    assert abs(crossing.exit.time - (start_time + timedelta(minutes=30))) < timedelta(seconds=1)
+
+    schedule = {"limitedApplicability": [{"schedule": [{"day": "SAT", "startTime": "00:00:00Z"}]}]}
+    index = corridor_index(zone("A", polygon(ring(0, 0, 0.1, 0.1)), **schedule))
+    assert index.crossings(route((-0.1, 0.05, 50), (0.2, 0.05, 50))) == []
+
+
+def test_antimeridian():
+    index = corridor_index(zone("A", polygon([[179.9, 0], [-179.9, 0], [-179.9, 0.1], [179.9, 0.1], [179.9, 0]])))
+    (crossing,) = index.crossings(route((179.8, 0.05, 50), (-179.8, 0.05, 50)))
+    assert crossing.entry.lon == pytest.approx(179.9, abs=1e-5)
+    assert crossing.exit.lon == pytest.approx(-179.9, abs=1e-5)
+
+
+def test_circle_across_antimeridian():
+    index = corridor_index(zone("A", circle(179.99, 10, 5000)))
+    (crossing,) = index.crossings(route((-179.99, 9.9, 50), (-179.99, 10.1, 50)))
+    assert crossing.entry.lat < 10 < crossing.exit.lat
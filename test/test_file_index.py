@@ -0,0 +1,104 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from conftest import circle, polygon, zone
+
+from ed318_pydantic.file_index import FeatureIndex, IndexedDataset, scan_features
+from ed318_pydantic.geometries import geometry_bounds
+from ed318_pydantic.models import FeatureCollection
+
+data_path = Path("test/data")
+
+
+@pytest.fixture
+def dataset(tmp_path: Path) -> Path:
+    path = tmp_path / "Example_Collection.json"
+    shutil.copy(data_path / "Example_Collection.json", path)
+    return path
+
+
+def test_scan_features():
+    document = b'{"name": "[{x}]", "features": [{"a": "}\\""}, {"b": [{}]}], "metadata": {"features": [{}]}}'
+    slices = [document[offset : offset + length] for offset, length in scan_features(document)]
+    assert [json.loads(item) for item in slices] == [{"a": '}"'}, {"b": [{}]}]
+
+
+def test_indexed_dataset(dataset: Path):
+    collection = FeatureCollection.model_validate_json(dataset.read_text())
+
+    with IndexedDataset(dataset) as indexed:
+        assert len(indexed) == len(collection.features)
+        assert FeatureIndex.index_path(dataset).exists()
+
+        for feature in collection.features:
+            identifier = feature.properties.identifier
+            assert identifier in indexed
+            assert indexed.get(identifier) == feature
+            assert indexed.index.entries[collection.features.index(feature)].bbox == geometry_bounds(feature.geometry)
+
+        with pytest.raises(KeyError):
+            indexed.get("UNKNOWN")
+
+        bounds = geometry_bounds(collection.features[0].geometry)
+        assert bounds is not None
+        assert collection.features[0] in indexed.query(bounds)
+        assert indexed.query((-10, -10, -9, -9)) == []
+
+
+def test_stale_index_is_rebuilt(dataset: Path):
+    FeatureIndex.for_file(dataset)
+
+    data = json.loads(dataset.read_text())
+    data["features"] = data["features"][:1]
+    dataset.write_text(json.dumps(data))
+
+    assert len(FeatureIndex.for_file(dataset).entries) == 1
+
+
+def test_corrupt_index_is_rebuilt(dataset: Path):
+    index = FeatureIndex.for_file(dataset)
+    index_path = FeatureIndex.index_path(dataset)
+    # e.g. a partially written index from an interrupted process
+    index_path.write_text(index_path.read_text()[:100])
+
+    assert FeatureIndex.for_file(dataset) == index
+    assert FeatureIndex.model_validate_json(index_path.read_text()) == index
+    # no temporary files are left behind
+    assert sorted(path.name for path in dataset.parent.iterdir()) == sorted([dataset.name, index_path.name])
+
+
+def test_unwritable_index(dataset: Path):
+    # an index path that can neither be read nor replaced, like an index in a read-only directory
+    FeatureIndex.index_path(dataset).mkdir()
+
+    with IndexedDataset(dataset) as indexed:
+        assert len(indexed) == len(FeatureCollection.model_validate_json(dataset.read_text()).features)
+    assert sorted(path.name for path in dataset.parent.iterdir()) == sorted(
+        [dataset.name, FeatureIndex.index_path(dataset).name]
+    )
+
+
+def test_query_across_antimeridian(dataset: Path):
+    data = json.loads(dataset.read_text())
+    data["features"] = [
+        zone("AM0", circle(179.99, -17, 5000)),
+        zone("AM1", polygon([[179.9, 10], [-179.9, 10], [-179.9, 11], [179.9, 11], [179.9, 10]])),
+        zone("EMPTY", {"type": "GeometryCollection", "geometries": []}),
+    ]
+    dataset.write_text(json.dumps(data))
+    FeatureIndex.for_file(dataset)
+
+    with IndexedDataset(dataset) as indexed:
+        # the index read back from disk keeps the missing bounding box of the empty geometry
+        assert [entry.bbox is None for entry in indexed.index.entries] == [False, False, True]
+
+        def identifiers(bounds: tuple[float, float, float, float]) -> list[str]:
+            return [feature.properties.identifier for feature in indexed.query(bounds)]
+
+        assert identifiers((-179.995, -17.01, -179.985, -16.99)) == ["AM0"]
+        assert identifiers((-179.95, 10.4, -179.94, 10.5)) == ["AM1"]
+        assert identifiers((179.95, 10.4, -179.95, 10.5)) == ["AM1"]
+        assert identifiers((0, 10, 1, 11)) == []
+        assert identifiers((-180, -90, 180, 90)) == ["AM0", "AM1"]
@@ -0,0 +1,48 @@
+from pathlib import Path
+
+from ed318_pydantic.geometries import GeometryCollection, Point, Polygon, flatten_geometry
+from ed318_pydantic.models import FeatureCollection
+
+data_path = Path("test/data")
+
+layer_0_50 = {"upper": 50, "upperReference": "AGL", "lower": 0, "lowerReference": "AGL"}
+layer_50_150 = {"upper": 150, "upperReference": "AGL", "lower": 50, "lowerReference": "AGL"}
+
+
+def test_flatten_geometry_collection():
+    collection = FeatureCollection.model_validate_json((data_path / "Example_GeoZone_2_Layers.json").read_text())
+    geometry = collection.features[0].geometry
+    assert isinstance(geometry, GeometryCollection)
+
+    pairs = geometry.flatten()
+    assert [type(g) for g, _ in pairs] == [Polygon, Polygon]
+    assert [(layer.lower, layer.upper) for _, layer in pairs] == [(50, 150), (0, 50)]
+    assert all(g.layer is layer for g, layer in pairs)
+
+
+def test_flatten_single_geometry():
+    point = Point.model_validate({"type": "Point", "coordinates": [2.6, 50.1], "layer": layer_0_50})
+    assert flatten_geometry(point) == [(point, point.layer)]
+
+
+def test_flatten_nested_geometry_collection():
+    collection = GeometryCollection.model_validate(
+        {
+            "type": "GeometryCollection",
+            "geometries": [
+                {"type": "Point", "coordinates": [0, 0], "layer": layer_0_50},
+                {
+                    "type": "GeometryCollection",
+                    "geometries": [
+                        {"type": "Point", "coordinates": [1, 1], "layer": layer_50_150},
+                        {"type": "LineString", "coordinates": [[2, 2], [3, 3]], "layer": layer_0_50},
+                    ],
+                },
+                {"type": "Point", "coordinates": [4, 4], "layer": layer_50_150},
+            ],
+        }
+    )
+
+    pairs = collection.flatten()
+    assert [g.type for g, _ in pairs] == ["Point", "Point", "LineString", "Point"]
+    assert [layer.upper for _, layer in pairs] == [50, 150, 50, 150]
@@ -0,0 +1,83 @@
+import json
+from datetime import UTC, datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from ed318_pydantic.interning import FrozenAuthority, FrozenVerticalLayer, Interner, deduplicate
+from ed318_pydantic.models import FeatureCollection
+
+data_path = Path("test/data")
+
+
+@pytest.fixture
+def collection() -> FeatureCollection:
+    data = json.loads((data_path / "Example_GeoZone_2_Layers.json").read_text())
+    duplicate = json.loads(json.dumps(data["features"][0]))
+    duplicate["properties"]["identifier"] = "NFZ6548"
+    data["features"].append(duplicate)
+    return FeatureCollection.model_validate(data)
+
+
+def test_deduplicate(collection: FeatureCollection):
+    expected = collection.model_dump(exclude_unset=True)
+    first, second = collection.features
+
+    deduplicate(collection)
+    assert collection.model_dump(exclude_unset=True) == expected
+
+    assert first.properties.zoneAuthority[0] is second.properties.zoneAuthority[0]
+    assert isinstance(first.properties.zoneAuthority[0], FrozenAuthority)
+    assert first.properties.limitedApplicability is not None and second.properties.limitedApplicability is not None
+    assert first.properties.limitedApplicability[0] is second.properties.limitedApplicability[0]
+    assert first.properties.identifier is not second.properties.identifier
+
+    layers = [layer for feature in collection.features for _, layer in feature.geometry.flatten()]
+    assert all(isinstance(layer, FrozenVerticalLayer) for layer in layers)
+    assert len({id(layer) for layer in layers}) == 2
+
+    with pytest.raises(ValidationError):
+        first.properties.zoneAuthority[0].email = "other@example.com"
+
+
+def test_deduplicate_is_idempotent(collection: FeatureCollection):
+    interner = Interner()
+    deduplicate(collection, interner)
+    size = len(interner)
+    authority = collection.features[0].properties.zoneAuthority[0]
+
+    deduplicate(collection, interner)
+    assert len(interner) == size
+    assert collection.features[0].properties.zoneAuthority[0] is authority
+
+
+def test_interned_models_are_hashable(collection: FeatureCollection):
+    deduplicate(collection)
+    by_authority: dict = {}
+    for feature in collection.features:
+        for authority in feature.properties.zoneAuthority:
+            by_authority.setdefault(authority, []).append(feature.properties.identifier)
+    assert len(by_authority) == 1
+
+    authority = collection.features[0].properties.zoneAuthority[0]
+    assert authority.name is not None
+    with pytest.raises(TypeError):
+        authority.name.append(authority.name[0])
+
+    copy = collection.model_copy(deep=True)
+    assert copy.model_dump() == collection.model_dump()
+
+
+def test_utc_offsets_are_kept(collection: FeatureCollection):
+    first, second = collection.features
+    assert first.properties.limitedApplicability is not None and second.properties.limitedApplicability is not None
+    first.properties.limitedApplicability[0].startDateTime = datetime(2025, 6, 2, 12, tzinfo=UTC)
+    second.properties.limitedApplicability[0].startDateTime = datetime(
+        2025, 6, 2, 13, tzinfo=timezone(timedelta(hours=1))
+    )
+    expected = collection.model_dump_json(exclude_unset=True)
+
+    deduplicate(collection)
+    assert first.properties.limitedApplicability[0] is not second.properties.limitedApplicability[0]
+    assert collection.model_dump_json(exclude_unset=True) == expected
@@ -1,9 +1,10 @@
+from datetime import UTC, datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 from pydantic import ValidationError
 
-from ed318_pydantic.models import Authority, Feature, FeatureCollection, TimePeriod, UASZone
+from ed318_pydantic.models import Authority, DailyPeriod, Feature, FeatureCollection, TimePeriod, UASZone
 
 data_path = Path("test/data")
 
@@ -42,3 +43,32 @@ def test_parse_zone_authority():
     path = data_path / "PartialExample_ZoneAuthority.json"
     zone_authority = Authority.model_validate_json(path.read_text())
     assert isinstance(zone_authority, Authority)
+
+
+def test_time_period_applies_at():
+    path = data_path / "PartialExample_TimePeriod.json"
+    time_period = TimePeriod.model_validate_json(path.read_text())
+
+    assert time_period.applies_at(datetime(2023, 11, 1, 16, 30, tzinfo=UTC))
+    assert not time_period.applies_at(datetime(2023, 11, 1, 17, 30, tzinfo=UTC))
+    assert time_period.applies_at(datetime(2023, 11, 5, 11, 0, tzinfo=UTC)), "Sunday schedule"
+    assert not time_period.applies_at(datetime(2023, 11, 4, 11, 0, tzinfo=UTC)), "Saturday"
+    assert time_period.applies_at(datetime(2023, 11, 1, 17, 30, tzinfo=timezone(timedelta(hours=1))))
+    assert not time_period.applies_at(datetime(2024, 4, 1, 16, 30, tzinfo=UTC)), "after endDateTime"
+
+
+def test_daily_period_overnight():
+    period = DailyPeriod.model_validate({"day": "ANY", "startTime": "22:00:00Z", "endTime": "06:00:00Z"})
+    assert period.applies_at(datetime(2024, 1, 1, 23, 0, tzinfo=UTC))
+    assert period.applies_at(datetime(2024, 1, 1, 5, 0, tzinfo=UTC))
+    assert not period.applies_at(datetime(2024, 1, 1, 12, 0, tzinfo=UTC))
+
+
+def test_daily_period_local_weekday():
+    # Monday 00:30 to 06:00 in UTC+1 starts on Sunday in UTC, the weekday is taken in the schedule's time zone
+    period = DailyPeriod.model_validate({"day": "MON", "startTime": "00:30:00+01:00", "endTime": "06:00:00+01:00"})
+    cet = timezone(timedelta(hours=1))
+    assert period.applies_at(datetime(2024, 1, 1, 0, 45, tzinfo=cet))
+    assert period.applies_at(datetime(2023, 12, 31, 23, 45, tzinfo=UTC))
+    assert not period.applies_at(datetime(2024, 1, 2, 0, 45, tzinfo=cet))
+    assert not period.applies_at(datetime(2024, 1, 1, 23, 45, tzinfo=UTC))
@@ -0,0 +1,145 @@
+import math
+from datetime import UTC, datetime
+
+import pytest
+from conftest import circle, polygon, ring, vertical_layer, zone
+
+np = pytest.importorskip("numpy")
+
+from ed318_pydantic.containment import RingSet  # noqa: E402
+from ed318_pydantic.models import FeatureCollection  # noqa: E402
+from ed318_pydantic.raster import ZONE_TYPES, altitude_bands, rasterize  # noqa: E402
+
+
+@pytest.fixture
+def collection() -> FeatureCollection:
+    return FeatureCollection.model_validate(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                zone("A", polygon(ring(0, 0, 4, 4)), "REQ_AUTHORIZATION"),
+                zone("B", polygon(ring(2, 2, 6, 6), layer=vertical_layer(0, 50))),
+                zone("C", circle(8.5, 8.5, 30_000, layer=vertical_layer(0, 1000, "ft")), "NO_RESTRICTION"),
+            ],
+        }
+    )
+
+
+def test_altitude_bands(collection: FeatureCollection):
+    assert altitude_bands(collection) == [(0, 50), (50, 120), (120, 304.8)]
+
+
+def test_rasterize(collection: FeatureCollection):
+    raster = rasterize(collection, (0, 0, 10, 10), 1.0, tile_size=3)
+    assert raster.mask.shape == raster.priority.shape == (3, 10, 10)
+
+    def cell(lon: float, lat: float) -> tuple[int, int]:
+        return int(10 - lat), int(lon)
+
+    # lowest band: A and B overlap, B is more restrictive
+    assert raster.priority[0][cell(3.5, 3.5)] == ZONE_TYPES.index("PROHIBITED") + 1
+    assert raster.zone_type_mask("REQ_AUTHORIZATION")[0][cell(3.5, 3.5)]
+    assert raster.zone_type_mask("PROHIBITED")[0][cell(3.5, 3.5)]
+    # middle band: B ends at 50 m
+    assert raster.priority[1][cell(3.5, 3.5)] == ZONE_TYPES.index("REQ_AUTHORIZATION") + 1
+    assert raster.priority[1][cell(5.5, 5.5)] == 0
+    # upper band: only the circle, which reaches 1000 ft
+    assert raster.priority[2].sum() == raster.priority[2][cell(8.5, 8.5)] == 1
+    assert raster.mask[2][cell(0.5, 0.5)] == 0
+
+    assert raster.zone_type_mask("REQ_AUTHORIZATION")[0].sum() == 16
+    assert raster.zone_type_mask("PROHIBITED")[0].sum() == 16
+
+
+def test_rasterize_active_zones():
+    period = {"startDateTime": "2026-01-01T00:00:00Z", "endDateTime": "2026-02-01T00:00:00Z"}
+    collection = FeatureCollection.model_validate(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                zone("A", polygon(ring(0, 0, 4, 4)), "REQ_AUTHORIZATION"),
+                zone("B", polygon(ring(2, 2, 6, 6)), limitedApplicability=[period]),
+            ],
+        }
+    )
+
+    active = rasterize(collection, (0, 0, 10, 10), 1.0, at=datetime(2026, 1, 15, tzinfo=UTC))
+    inactive = rasterize(collection, (0, 0, 10, 10), 1.0, at=datetime(2026, 3, 1, tzinfo=UTC))
+    assert active.zone_type_mask("PROHIBITED")[0].sum() == 16
+    assert not inactive.zone_type_mask("PROHIBITED").any()
+    assert inactive.zone_type_mask("REQ_AUTHORIZATION")[0].sum() == 16
+    assert (rasterize(collection, (0, 0, 10, 10), 1.0).mask == active.mask).all()
+
+
+def test_rasterize_matches_containment():
+    rng = np.random.default_rng(318)
+    angles = np.sort(rng.uniform(0, 2 * math.pi, 40))
+    radii = rng.uniform(2, 4, 40)
+    positions = [[5 + float(r * math.cos(a)), 5 + float(r * math.sin(a))] for r, a in zip(radii, angles)]
+    collection = FeatureCollection.model_validate(
+        {"type": "FeatureCollection", "features": [zone("A", polygon([*positions, positions[0]]))]}
+    )
+
+    raster = rasterize(collection, (0, 0, 10, 10), 0.1, tile_size=17, max_workers=4)
+    centers = np.arange(100) * 0.1 + 0.05
+    expected = RingSet(collection.features[0].geometry).contains(centers[None, :], 10 - centers[:, None])
+    assert (raster.zone_type_mask("PROHIBITED")[0] == expected).all()
+
+
+def test_rasterize_antimeridian():
+    antimeridian = [[178, 0], [-178, 0], [-178, 2], [178, 2], [178, 0]]
+    collection = FeatureCollection.model_validate(
+        {"type": "FeatureCollection", "features": [zone("A", polygon(antimeridian))]}
+    )
+
+    east = rasterize(collection, (170, 0, 180, 2), 1.0)
+    west = rasterize(collection, (-180, 0, -170, 2), 1.0)
+    assert east.priority[0].sum(axis=1).tolist() == [2 * 5, 2 * 5]
+    assert west.priority[0].sum(axis=1).tolist() == [2 * 5, 2 * 5]
+
+
+@pytest.mark.parametrize("bounds", [(175, 0, 185, 2), (175, 0, -175, 2)])
+def test_rasterize_antimeridian_grid(bounds: tuple[float, float, float, float]):
+    antimeridian = [[178, 0], [-178, 0], [-178, 2], [178, 2], [178, 0]]
+    collection = FeatureCollection.model_validate(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                zone("A", polygon(antimeridian)),
+                zone("B", polygon(ring(-179, 0, -178, 2)), "REQ_AUTHORIZATION"),
+                zone("C", circle(176.5, 1, 60_000), "NO_RESTRICTION"),
+            ],
+        }
+    )
+
+    raster = rasterize(collection, bounds, 1.0)
+    assert raster.bounds == (175, 0, 185, 2)
+    assert raster.zone_type_mask("PROHIBITED")[0].tolist() == [[False] * 3 + [True] * 4 + [False] * 3] * 2
+    assert raster.zone_type_mask("REQ_AUTHORIZATION")[0].tolist() == [[False] * 6 + [True] + [False] * 3] * 2
+    assert raster.zone_type_mask("NO_RESTRICTION")[0].tolist() == [[False, True] + [False] * 8] * 2
+
+
+@pytest.mark.slow
+def test_many_zones_match_row_by_row():
+    rng = np.random.default_rng(318)
+    features = []
+    for i in range(300):
+        x, y = rng.uniform(0, 10, 2)
+        angles = np.sort(rng.uniform(0, 2 * math.pi, 60))
+        radii = rng.uniform(0.2, 0.6, 60)
+        positions = [[float(x + r * math.cos(a)), float(y + r * math.sin(a))] for r, a in zip(radii, angles)]
+        features.append(zone(f"Z{i}", polygon([*positions, positions[0]])))
+    collection = FeatureCollection.model_validate({"type": "FeatureCollection", "features": features})
+
+    raster = rasterize(collection, (0, 0, 10, 10), 0.01, max_workers=1)
+
+    # reference: scanline filling one row at a time
+    expected = np.zeros((1000, 1000), dtype=bool)
+    for feature in collection.features:
+        rings = RingSet(feature.geometry)
+        _, south, _, north = rings.bounds
+        for row in range(max(0, math.floor((10 - north) / 0.01)), min(1000, math.ceil((10 - south) / 0.01))):
+            _, crossings = rings.crossings([10 - (row + 0.5) * 0.01])
+            for west, east in zip(crossings[::2], crossings[1::2]):
+                expected[row, max(0, math.ceil(west / 0.01 - 0.5)) : max(0, math.ceil(east / 0.01 - 0.5))] = True
+    assert (raster.zone_type_mask("PROHIBITED")[0] == expected).all()
@@ -0,0 +1,147 @@
+import asyncio
+import json
+import random
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from ed318_pydantic.models import Feature, FeatureCollection
+from ed318_pydantic.store import ZoneStore
+
+data_path = Path("test/data")
+
+
+@pytest.fixture
+def raw_features() -> list[dict]:
+    return json.loads((data_path / "Example_Collection.json").read_text())["features"]
+
+
+def test_upsert_and_delete(raw_features: list[dict]):
+    collection = FeatureCollection.model_validate({"type": "FeatureCollection", "features": raw_features})
+    store = ZoneStore(collection.features)
+    identifiers = {feature.properties.identifier for feature in collection.features}
+    assert len(store) == len(identifiers)
+    assert store.version == 0
+
+    before = store.snapshot()
+    identifier = collection.features[0].properties.identifier
+    zone_type = collection.features[0].properties.type
+
+    change = store.delete(identifier)
+    assert change.action == "delete" and change.version == before.version + 1
+    assert identifier not in store
+    assert identifier not in store.snapshot().bounds
+    assert identifier not in store.snapshot().by_type.get(zone_type, frozenset())
+
+    # snapshots taken earlier are unaffected
+    assert identifier in before.features
+    assert identifier in before.by_type[zone_type]
+
+    change = store.upsert(json.dumps(raw_features[0]))
+    assert change.action == "upsert"
+    assert store.get(identifier) == collection.features[0]
+    assert store.snapshot().bounds[identifier] == before.bounds[identifier]
+
+    with pytest.raises(KeyError):
+        store.delete("UNKNOWN")
+
+    # zones with empty geometries are stored, but have no bounding box
+    empty = raw_features[0] | {"geometry": {"type": "GeometryCollection", "geometries": []}}
+    store.upsert(empty)
+    assert identifier in store and identifier not in store.snapshot().bounds
+    store.delete(identifier)
+    assert identifier not in store
+
+
+def test_subscribe(raw_features: list[dict]):
+    async def main():
+        store = ZoneStore()
+        queue = store.subscribe()
+
+        store.upsert(raw_features[0])
+        thread = threading.Thread(target=store.delete, args=(raw_features[0]["properties"]["identifier"],))
+        thread.start()
+        thread.join()
+
+        first = await asyncio.wait_for(queue.get(), 1)
+        second = await asyncio.wait_for(queue.get(), 1)
+        assert (first.action, first.version) == ("upsert", 1)
+        assert (second.action, second.version) == ("delete", 2)
+
+        store.unsubscribe(queue)
+        store.upsert(raw_features[0])
+        assert queue.empty()
+
+    asyncio.run(main())
+
+
+def test_concurrent_delete(raw_features: list[dict]):
+    store = ZoneStore([Feature.model_validate(raw_features[0])])
+    identifier = raw_features[0]["properties"]["identifier"]
+    changes = []
+
+    def delete():
+        try:
+            changes.append(store.delete(identifier))
+        except KeyError:
+            pass
+
+    # hold the lock so that both deletions run up to it before either is applied
+    threads = [threading.Thread(target=delete) for _ in range(2)]
+    with store._lock:
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+    for thread in threads:
+        thread.join()
+
+    assert [change.version for change in changes] == [1]
+    assert store.version == 1
+
+
+def many_features(raw_features: list[dict], count: int) -> list[Feature]:
+    template = Feature.model_validate(raw_features[0])
+    return [
+        template.model_copy(update={"properties": template.properties.model_copy(update={"identifier": f"Z{i}"})})
+        for i in range(count)
+    ]
+
+
+def test_many_updates(raw_features: list[dict]):
+    features = many_features(raw_features, 2_000)
+    store = ZoneStore(features[:1_000])
+    expected = {feature.properties.identifier: feature for feature in features[:1_000]}
+    snapshots = [(store.snapshot(), dict(expected))]
+
+    rng = random.Random(318)
+    for _ in range(3_000):
+        feature = rng.choice(features)
+        identifier = feature.properties.identifier
+        if identifier in expected and rng.random() < 0.5:
+            store.delete(identifier)
+            del expected[identifier]
+        else:
+            store.upsert(feature)
+            expected[identifier] = feature
+        if rng.random() < 0.01:
+            snapshots.append((store.snapshot(), dict(expected)))
+
+    for snapshot, features_at_version in snapshots:
+        assert dict(snapshot.features) == features_at_version
+        assert set(snapshot.bounds) == set(features_at_version)
+        assert {identifier for zones in snapshot.by_type.values() for identifier in zones} == set(features_at_version)
+
+
+@pytest.mark.slow
+def test_update_scaling(raw_features: list[dict]):
+    features = many_features(raw_features, 16_000)
+    store = ZoneStore(features)
+    before = store.snapshot()
+    for feature in features[:1_000]:
+        store.upsert(feature)
+
+    assert len(store) == len(before.features) == 16_000
+    assert store.version == before.version + 1_000
+    assert all(store.get(feature.properties.identifier) is feature for feature in features[:1_000])
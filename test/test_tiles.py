@@ -0,0 +1,93 @@
+from pathlib import Path
+
+from conftest import circle, polygon, ring, zone
+
+from ed318_pydantic.geometries import GeometryCollection, Point, Polygon, geometry_bounds, merge_bounds
+from ed318_pydantic.models import FeatureCollection
+from ed318_pydantic.tiles import TileManifest, partition, quadkey, tile_xy, tiles_for_bounds, write_partitions
+
+data_path = Path("test/data")
+
+
+def test_quadkey():
+    assert quadkey(3, 5, 3) == "213"
+    x, y = tile_xy(-180, 85, 1)
+    assert quadkey(x, y, 1) == "0"
+    x, y = tile_xy(179.9, -85, 1)
+    assert quadkey(x, y, 1) == "3"
+
+
+def test_tiles_for_bounds():
+    assert tiles_for_bounds((-1, -1, 1, 1), 1) == ["0", "1", "2", "3"]
+    assert tiles_for_bounds((10, 10, 11, 11), 1) == ["1"]
+    assert tiles_for_bounds((170, 10, 190, 11), 1) == ["1", "0"]
+    assert tiles_for_bounds((170, 10, -170, 11), 1) == ["1", "0"]
+    assert tiles_for_bounds((-180, -1, 180, 1), 1) == ["0", "1", "2", "3"]
+
+
+def test_circle_bounds():
+    collection = FeatureCollection.model_validate_json((data_path / "Example_GeoZone_Circle.json").read_text())
+    bounds = geometry_bounds(collection.features[0].geometry)
+    assert bounds is not None
+    west, south, east, north = bounds
+    # 3500 m radius around 2.636866, 50.122901
+    assert abs((north - south) / 2 - 0.03148) < 1e-4
+    assert abs((east - west) / 2 - 0.04909) < 1e-4
+
+
+def test_antimeridian_circle_bounds():
+    bounds = geometry_bounds(Point.model_validate(circle(179.99, -17, 5000)))
+    assert bounds is not None
+    west, _, east, _ = bounds
+    assert west < 179.99 < 180 < east
+
+    x, y = tile_xy(-179.99, -17, 12)
+    assert quadkey(x, y, 12) in tiles_for_bounds((west, -17, east, -17), 12)
+
+
+def test_antimeridian_polygon_bounds():
+    # about 2 km wide, crossing the antimeridian
+    antimeridian = [[179.99, -17], [-179.99, -17], [-179.99, -16.99], [179.99, -16.99], [179.99, -17]]
+    bounds = geometry_bounds(Polygon.model_validate(polygon(antimeridian)))
+    assert bounds is not None
+    assert bounds == (179.99, -17, 180.01, -16.99)
+    assert len(tiles_for_bounds(bounds, 12)) <= 4
+
+
+def test_merge_bounds():
+    assert merge_bounds([(170, 0, 175, 1), (-175, -1, -170, 0)]) == (170, -1, 190, 1)
+    assert merge_bounds([(-10, 0, 10, 1), (170, 0, 190, 1)]) == (-10, 0, 190, 1)
+    assert merge_bounds([(-180, 0, 180, 1), (10, 0, 20, 1)]) == (-180, 0, 180, 1)
+    assert merge_bounds([None, (10, 0, 20, 1)]) == (10, 0, 20, 1)
+    assert merge_bounds([]) is None
+
+
+def test_empty_geometry():
+    empty = {"type": "GeometryCollection", "geometries": []}
+    assert geometry_bounds(GeometryCollection.model_validate(empty)) is None
+
+    collection = FeatureCollection.model_validate(
+        {"type": "FeatureCollection", "features": [zone("EMPTY", empty), zone("SQUARE", polygon(ring(0, 0, 1, 1)))]}
+    )
+    tiles = partition(collection, 12)
+    assert tiles
+    assert {feature.properties.identifier for tile in tiles.values() for feature in tile.features} == {"SQUARE"}
+
+
+def test_write_partitions(tmp_path: Path):
+    collection = FeatureCollection.model_validate_json((data_path / "Example_Collection.json").read_text())
+    manifest = write_partitions(collection, tmp_path, zoom=12)
+
+    assert TileManifest.model_validate_json((tmp_path / "manifest.json").read_text()) == manifest
+    assert manifest.tiles
+
+    identifiers = set()
+    for filename in manifest.tiles.values():
+        tile = FeatureCollection.model_validate_json((tmp_path / filename).read_text())
+        assert tile.metadata == collection.metadata
+        identifiers.update(feature.properties.identifier for feature in tile.features)
+    assert identifiers == {feature.properties.identifier for feature in collection.features}
+
+    bounds = geometry_bounds(collection.features[0].geometry)
+    assert bounds is not None
+    assert len(manifest.files_for_bounds(bounds)) == len(tiles_for_bounds(bounds, 12))